@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the DynamicArray implementation.
+
+Compares the bulk-copy DynamicArray against a per-element loop version
+(how DynamicArray used to shift elements) and the built-in list, and the
+mid-array edit cost of GapBuffer, ChunkedList and EditableArray.
+
+Run with: python benchmark.py
+"""
+
+import timeit
+
+import random
+
+from implementation import (
+    AdditiveGrowth,
+    ChunkedList,
+    CPythonGrowth,
+    DynamicArray,
+    EditableArray,
+    GapBuffer,
+    GeometricGrowth,
+)
+
+
+class LoopDynamicArray(DynamicArray):
+    """DynamicArray that copies and shifts one element per loop iteration."""
+
+    def _copy_into(self, new_array):
+        for i in range(self.length):
+            new_array[i] = self.array[i]
+
+    def insert(self, index, value):
+        if not 0 <= index <= self.length:
+            raise IndexError("Index out of range")
+        if self.length == self.capacity:
+            self._ensure_capacity(self.length + 1)
+        for i in range(self.length, index, -1):
+            self.array[i] = self.array[i-1]
+        self.array[index] = value
+        self.length += 1
+
+    def remove(self, index):
+        if not 0 <= index < self.length:
+            raise IndexError("Index out of range")
+        for i in range(index, self.length - 1):
+            self.array[i] = self.array[i+1]
+        self.array[self.length - 1] = self._empty
+        self.length -= 1
+        self._maybe_shrink()
+
+
+def filled(cls, n):
+    """Return an instance of cls (DynamicArray subclass or list) holding range(n)."""
+    container = cls()
+    for i in range(n):
+        container.append(i)
+    return container
+
+
+def time_op(stmt, setup, number):
+    """Return the best per-call time in microseconds over a few repeats."""
+    best = min(timeit.repeat(stmt, setup=setup, number=number, repeat=3))
+    return best / number * 1e6
+
+
+def bench_append(n):
+    """Time building an n-element container with append (includes resizes)."""
+    results = {}
+    for name, cls in (("loop", LoopDynamicArray), ("bulk", DynamicArray), ("list", list)):
+        results[name] = time_op(lambda: filled(cls, n), lambda: None, 1)
+    return results
+
+
+def bench_middle(n, number=200):
+    """Time one insert followed by one remove in the middle of n elements."""
+    results = {}
+    for name, cls in (("loop", LoopDynamicArray), ("bulk", DynamicArray), ("list", list)):
+        container = filled(cls, n)
+        mid = n // 2
+        if cls is list:
+            stmt = lambda: (container.insert(mid, -1), container.pop(mid))
+        else:
+            stmt = lambda: (container.insert(mid, -1), container.remove(mid))
+        results[name] = time_op(stmt, lambda: None, number)
+    return results
+
+
+def bench_batch_insert(n, k=1000):
+    """Time inserting k values in the middle: k single inserts vs one insert_many."""
+    values = list(range(k))
+    mid = n // 2
+
+    def singles():
+        container = filled(DynamicArray, n)
+        for offset, value in enumerate(values):
+            container.insert(mid + offset, value)
+
+    def batch():
+        container = filled(DynamicArray, n)
+        container.insert_many(mid, values)
+
+    def builtin():
+        container = list(range(n))
+        container[mid:mid] = values
+
+    return {
+        "insert x k": time_op(singles, lambda: None, 1),
+        "insert_many": time_op(batch, lambda: None, 1),
+        "list slice": time_op(builtin, lambda: None, 1),
+    }
+
+
+def bench_policies(bursts=50, burst_size=2000):
+    """
+    Run a bursty workload (append a burst one element at a time, pop most
+    of it back off the end, repeat) under each growth policy and report
+    the resize telemetry it produced. The last case reserves one burst up
+    front, so neither the fills nor the drains should resize at all.
+    """
+    cases = {
+        "geometric x2": (GeometricGrowth(2), 0),
+        "geometric x1.5": (GeometricGrowth(1.5), 0),
+        "additive 512": (AdditiveGrowth(512), 0),
+        "cpython": (CPythonGrowth(), 0),
+        "x2 + reserve": (GeometricGrowth(2), burst_size),
+    }
+    keep = burst_size // 10
+    for name, (policy, reserved) in cases.items():
+        container = DynamicArray(growth=policy)
+        if reserved:
+            container.reserve(reserved)
+
+        def workload():
+            for _ in range(bursts):
+                for i in range(burst_size - keep):
+                    container.append(i)
+                while container.length > keep:
+                    container.remove(container.length - 1)
+
+        seconds = timeit.timeit(workload, number=1)  # once, so the counters cover one run
+        stats = container.resize_stats()
+        print(f"{name:>16}: {stats['resize_count']:>6} resizes, "
+              f"{stats['bytes_copied'] / 1024:>10.1f} KiB copied, "
+              f"peak capacity {stats['peak_capacity']:>6}, "
+              f"{seconds * 1000:>8.1f}ms")
+
+
+def bench_edits(n, edits=2000):
+    """
+    Time insert+remove pairs on an n-element sequence, once clustered around
+    one position (like typing) and once at random positions.
+    """
+    rng = random.Random(42)
+    center = n // 3
+    local = [center + rng.randint(-8, 8) for _ in range(edits)]
+    scattered = [rng.randrange(n) for _ in range(edits)]
+
+    def run(cls, positions):
+        container = cls()
+        if isinstance(container, DynamicArray):
+            container.extend(range(n))
+        else:
+            for i in range(n):
+                container.append(i)
+
+        def edit():
+            for pos in positions:
+                container.insert(pos, -1)
+                container.remove(pos)
+        return time_op(edit, lambda: None, 1) / edits
+
+    results = {}
+    for name, cls in (("DynamicArray", DynamicArray), ("GapBuffer", GapBuffer),
+                      ("ChunkedList", ChunkedList), ("EditableArray", EditableArray)):
+        results[f"{name} local"] = run(cls, local)
+        results[f"{name} random"] = run(cls, scattered)
+    return results
+
+
+def print_table(title, rows):
+    """Print benchmark rows as an aligned table of microsecond timings."""
+    print(f"\n{title}")
+    columns = list(rows[0][1])
+    print(f"{'n':>10} " + " ".join(f"{c:>14}" for c in columns))
+    for n, results in rows:
+        print(f"{n:>10} " + " ".join(f"{results[c]:>12.1f}us" for c in columns))
+
+
+if __name__ == "__main__":
+    sizes = [1_000, 10_000, 100_000]
+
+    print_table("append n elements (total time)", [(n, bench_append(n)) for n in sizes])
+    print_table("insert + remove at the middle (per pair)", [(n, bench_middle(n)) for n in sizes])
+    print_table("insert 1000 values at the middle (total time)",
+                [(n, bench_batch_insert(n)) for n in sizes[:2]])
+
+    for n in sizes:
+        print(f"\ninsert + remove per pair at n = {n}")
+        for name, micros in bench_edits(n).items():
+            print(f"{name:>22}: {micros:>10.2f}us")
+
+    print("\nGrowth policies under a bursty workload")
+    bench_policies()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Empirical complexity checks for a sample of implementation.py.
+
+The functions in CASES (five array algorithms and three DynamicArray
+operations) each document a Big-O bound. This harness runs each one
+across growing input sizes, records the time and peak memory per call,
+fits the growth curve and fails if the measured curve grows faster than
+the documented complexity allows, or much slower, which usually means the
+case is not exercising the documented path (or the bound is stale).
+
+Run with: python complexity_benchmark.py [--max-size 10000000] [--tolerance 0.35]
+
+The fit is a log-log regression: for a model f(n), log(time) should grow
+with the same slope as log(f(n)) across the measured sizes, so O(n) has
+slope 1, O(n^2) slope 2 and O(log n) a slope near 0. Sizes below
+--min-fit-size are reported but left out of the fit, because fixed
+interpreter overhead dominates them.
+"""
+
+import argparse
+import math
+import random
+import sys
+import timeit
+import tracemalloc
+
+from implementation import (
+    DynamicArray,
+    binary_search,
+    linear_search,
+    max_subarray_sum,
+    rotate_array,
+    two_sum,
+)
+
+
+MODELS = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n^2)": lambda n: float(n) ** 2,
+}
+
+
+def _filled_dynamic_array(n):
+    arr = DynamicArray()
+    arr.extend(range(n))
+    return arr
+
+
+def _dynamic_insert_remove(arr):
+    mid = len(arr) // 2
+    arr.insert(mid, -1)
+    arr.remove(mid)
+
+
+# (name, documented complexity, setup(n) -> state, operation(state))
+CASES = [
+    ("linear_search (miss)", "O(n)",
+     lambda n: list(range(n)),
+     lambda arr: linear_search(arr, -1)),
+    ("binary_search", "O(log n)",
+     lambda n: list(range(n)),
+     lambda arr: binary_search(arr, random.randrange(len(arr)))),
+    ("two_sum (no pair)", "O(n)",
+     lambda n: list(range(n)),
+     lambda arr: two_sum(arr, -1)),
+    ("rotate_array", "O(n)",
+     lambda n: list(range(n)),
+     lambda arr: rotate_array(arr, len(arr) // 3)),
+    ("max_subarray_sum", "O(n)",
+     lambda n: [random.randint(-100, 100) for _ in range(n)],
+     max_subarray_sum),
+    ("DynamicArray.__getitem__", "O(1)",
+     _filled_dynamic_array,
+     lambda arr: arr[len(arr) // 2]),
+    ("DynamicArray.append", "O(1)",
+     _filled_dynamic_array,
+     lambda arr: arr.append(0)),
+    ("DynamicArray.insert+remove (middle)", "O(n)",
+     _filled_dynamic_array,
+     _dynamic_insert_remove),
+]
+
+
+def measure(setup, operation, n):
+    """
+    Time one operation on an input of size n and record its peak memory.
+
+    Returns:
+        (seconds per call, peak bytes allocated during one call)
+    """
+    state = setup(n)
+    timer = timeit.Timer(lambda: operation(state))
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=3, number=number)) / number
+
+    tracemalloc.start()
+    operation(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def slope(xs, ys):
+    """Least-squares slope of ys against xs."""
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def fit_model(sizes, times):
+    """
+    Return the model from MODELS whose curve best matches the measurements,
+    along with the measured log-log slope.
+    """
+    log_n = [math.log(n) for n in sizes]
+    measured = slope(log_n, [math.log(t) for t in times])
+
+    def error(model):
+        f = MODELS[model]
+        ratios = [math.log(t / f(n)) for n, t in zip(sizes, times)]
+        mean = sum(ratios) / len(ratios)
+        return sum((r - mean) ** 2 for r in ratios)
+
+    return min(MODELS, key=error), measured
+
+
+def expected_slope(model, sizes):
+    """Log-log slope the documented model predicts over the given sizes."""
+    f = MODELS[model]
+    return slope([math.log(n) for n in sizes], [math.log(f(n)) for n in sizes])
+
+
+def run(max_size, min_fit_size, tolerance):
+    """Run every case and return the names of those whose slope is outside the tolerance."""
+    sizes = [10 ** e for e in range(1, int(math.log10(max_size)) + 1)]
+    fit_sizes = [n for n in sizes if n >= min_fit_size]
+    failures = []
+
+    for name, documented, setup, operation in CASES:
+        print(f"\n{name} (documented {documented})")
+        print(f"{'n':>10} {'time/op':>14} {'peak memory':>14}")
+        times = {}
+        for n in sizes:
+            seconds, peak = measure(setup, operation, n)
+            times[n] = seconds
+            print(f"{n:>10} {seconds * 1e6:>12.3f}us {peak:>12,d} B")
+
+        if len(fit_sizes) < 2:
+            print("  not enough sizes to fit a curve")
+            continue
+
+        best, measured = fit_model(fit_sizes, [times[n] for n in fit_sizes])
+        expected = expected_slope(documented, fit_sizes)
+        low, high = expected - tolerance, expected + tolerance
+        if measured > high:
+            status = "FAIL (grows faster than documented)"
+        elif measured < low:
+            status = "FAIL (grows slower than documented)"
+        else:
+            status = "ok"
+        print(f"  best fit {best}, slope {measured:.2f} "
+              f"(allowed {low:.2f} to {high:.2f}): {status}")
+        if status != "ok":
+            failures.append(name)
+
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-size", type=int, default=10 ** 6,
+                        help="largest input size, a power of 10 (default: 10^6)")
+    parser.add_argument("--min-fit-size", type=int, default=1000,
+                        help="smallest size used when fitting curves (default: 1000)")
+    parser.add_argument("--tolerance", type=float, default=0.35,
+                        help="allowed deviation of the log-log slope (default: 0.35)")
+    args = parser.parse_args()
+
+    failures = run(args.max_size, args.min_fit_size, args.tolerance)
+    if failures:
+        print(f"\nMeasured growth does not match the documented complexity for: {', '.join(failures)}")
+        sys.exit(1)
+    print("\nAll measured curves are within their documented complexity.")
@@ -3,21 +3,161 @@
 Implementation of common array/list operations and algorithms in Python.
 """
 
+import array
+import bisect
+import itertools
+import math
+import mmap
+import operator
+import os
+import pickle
+import struct
+import tempfile
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python paths are used without it
+    np = None
+
+
+class GeometricGrowth:
+    """
+    Multiply the capacity by `factor` when full; divide it by `factor` when
+    occupancy falls below 1/factor**2. The gap between the two thresholds
+    stops the array from thrashing when it hovers around a boundary.
+    
+    GeometricGrowth(2) is the classic double/halve-at-1/4 policy.
+    """
+    
+    def __init__(self, factor=2):
+        if factor <= 1:
+            raise ValueError("Growth factor must be greater than 1")
+        self.factor = factor
+    
+    def grow(self, capacity, needed):
+        """Return a capacity of at least `needed` slots."""
+        while capacity < needed:
+            capacity = max(capacity + 1, int(capacity * self.factor))
+        return capacity
+    
+    def shrink(self, capacity, length):
+        """Return the capacity to use after a removal leaves `length` elements."""
+        while capacity > 1 and length < capacity / (self.factor ** 2):
+            capacity = max(1, int(capacity / self.factor))
+        return capacity
+
+
+class AdditiveGrowth:
+    """
+    Grow and shrink in fixed chunks of `chunk` slots.
+    
+    Memory overhead is bounded by 2 * chunk slots, at the cost of O(n / chunk)
+    copies per element appended, so pick a chunk close to the expected burst size.
+    """
+    
+    def __init__(self, chunk=1024):
+        if chunk < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self.chunk = chunk
+    
+    def grow(self, capacity, needed):
+        """Return the smallest multiple of `chunk` holding `needed` slots."""
+        return max(capacity, math.ceil(needed / self.chunk) * self.chunk)
+    
+    def shrink(self, capacity, length):
+        """Release whole chunks once more than two of them are unused."""
+        if capacity - length > 2 * self.chunk:
+            return (math.ceil(length / self.chunk) + 1) * self.chunk
+        return capacity
+
+
+class CPythonGrowth:
+    """
+    The over-allocation formula used by CPython's list_resize():
+    new_capacity = (n + n // 8 + 6) rounded down to a multiple of 4.
+    
+    Grows by about 12.5%, which wastes little memory but resizes more often
+    than doubling. Shrinks when occupancy drops below half.
+    """
+    
+    @staticmethod
+    def _overallocate(n):
+        return (n + (n >> 3) + 6) & ~3
+    
+    def grow(self, capacity, needed):
+        """Return the over-allocated capacity for `needed` slots."""
+        return max(needed, self._overallocate(needed))
+    
+    def shrink(self, capacity, length):
+        """Return the capacity to use after a removal leaves `length` elements."""
+        if length < capacity // 2:
+            return max(1, self._overallocate(length))
+        return capacity
+
+
 class DynamicArray:
     """
     A simple implementation of a dynamic array to demonstrate how Python lists work internally.
     This is for educational purposes - in practice, use Python's built-in list.
+    
+    By default elements are stored as references in a Python list. Passing a
+    typecode from the `array` module (e.g. 'd' for float, 'q' for int64) stores
+    them unboxed in a contiguous typed buffer instead, which uses far less
+    memory and can be shared with NumPy without copying:
+    
+        arr = DynamicArray(typecode='d')
+        np.frombuffer(arr.buffer(), dtype=np.float64)
+    
+    How capacity grows and shrinks is decided by a growth policy: any object
+    with grow(capacity, needed) and shrink(capacity, length) methods, such as
+    GeometricGrowth, AdditiveGrowth or CPythonGrowth. The resize_count,
+    bytes_copied and peak_capacity counters record what the policy cost.
     """
     
-    def __init__(self):
+    def __init__(self, typecode=None, growth=None):
         """Initialize an empty array with capacity 1."""
+        if typecode in ("u", "w"):
+            raise ValueError(f"Typecode '{typecode}' holds characters, not numbers; use a str or a list")
+        self.typecode = typecode
+        self._empty = None if typecode is None else array.array(typecode, [0])[0]
+        self._itemsize = struct.calcsize('P') if typecode is None else array.array(typecode).itemsize
+        self.growth = growth if growth is not None else GeometricGrowth(2)
         self.capacity = 1
         self.length = 0
         self.array = self._create_array(self.capacity)
+        self._reserved = 0
+        
+        # Resize telemetry
+        self.resize_count = 0
+        self.bytes_copied = 0
+        self.peak_capacity = self.capacity
     
     def _create_array(self, capacity):
         """Create a new array with given capacity."""
-        return [None] * capacity
+        if self.typecode is None:
+            return [None] * capacity
+        return array.array(self.typecode, [self._empty]) * capacity
+    
+    def buffer(self):
+        """
+        Return a zero-copy memoryview over the used part of a typed array.
+        
+        The view is invalidated by the next resize, so take a fresh one
+        after appending or removing elements.
+        """
+        if self.typecode is None:
+            raise TypeError("Only typed arrays support the buffer protocol")
+        return memoryview(self.array)[:self.length]
+    
+    def __buffer__(self, flags):
+        """
+        Expose the buffer protocol, e.g. memoryview(arr).
+        
+        Python only honours __buffer__ on classes from 3.12 on (PEP 688); on
+        older versions memoryview(arr) raises TypeError, so call buffer().
+        """
+        return self.buffer()
     
     def __len__(self):
         """Return the number of elements in the array."""
@@ -38,7 +178,7 @@ class DynamicArray:
     def append(self, value):
         """Add an element to the end of the array."""
         if self.length == self.capacity:
-            self._resize(2 * self.capacity)  # Double the capacity
+            self._ensure_capacity(self.length + 1)
         
         self.array[self.length] = value
         self.length += 1
@@ -46,26 +186,101 @@ class DynamicArray:
     def _resize(self, new_capacity):
         """Resize the array to the new capacity."""
         new_array = self._create_array(new_capacity)
-        
-        # Copy existing elements
-        for i in range(self.length):
-            new_array[i] = self.array[i]
+        self._copy_into(new_array)
         
         self.array = new_array
         self.capacity = new_capacity
+        
+        self.resize_count += 1
+        self.bytes_copied += self.length * self._itemsize
+        self.peak_capacity = max(self.peak_capacity, new_capacity)
+    
+    def _copy_into(self, new_array):
+        """Copy the existing elements into new_array in one bulk slice copy."""
+        new_array[:self.length] = self.array[:self.length]
+    
+    def _ensure_capacity(self, min_capacity):
+        """Grow according to the growth policy until min_capacity slots are available."""
+        if min_capacity <= self.capacity:
+            return
+        self._resize(self.growth.grow(self.capacity, min_capacity))
+    
+    def _maybe_shrink(self):
+        """Let the growth policy release capacity after a removal."""
+        if self.length == 0:
+            return
+        new_capacity = max(self.growth.shrink(self.capacity, self.length),
+                           self.length, self._reserved)
+        if new_capacity < self.capacity:
+            self._resize(new_capacity)
+    
+    def reserve(self, capacity):
+        """
+        Make room for at least `capacity` elements up front.
+        
+        The reserved capacity also acts as a floor: removals will not shrink
+        the array below it until shrink_to_fit() is called.
+        """
+        self._reserved = capacity
+        if capacity > self.capacity:
+            self._resize(capacity)
+    
+    def shrink_to_fit(self):
+        """Release all unused capacity and clear any reserve() hint."""
+        self._reserved = 0
+        new_capacity = max(1, self.length)
+        if new_capacity != self.capacity:
+            self._resize(new_capacity)
+    
+    def resize_stats(self):
+        """Return the resize telemetry counters as a dict."""
+        return {
+            "resize_count": self.resize_count,
+            "bytes_copied": self.bytes_copied,
+            "peak_capacity": self.peak_capacity,
+            "capacity": self.capacity,
+            "length": self.length,
+        }
+    
+    def _as_storage(self, values):
+        """Convert values to a sequence that can be slice-assigned into the array."""
+        if self.typecode is None:
+            return list(values)
+        return array.array(self.typecode, values)
+    
+    def _shift_right(self, index, k):
+        """
+        Move array[index:length] k slots to the right in place, into spare capacity.
+        
+        Inserting k slots makes list and array.array memmove their tail
+        without a temporary copy; the k spare slots pushed past capacity
+        are then dropped. The slots at index hold placeholders afterwards.
+        """
+        self.array[index:index] = self._create_array(k)
+        del self.array[self.capacity:]
+    
+    def _shift_left(self, index, k):
+        """
+        Move array[index + k:length] k slots to the left in place, over the
+        removed elements, and refill the k freed slots at the end.
+        """
+        del self.array[index:index + k]
+        self.array.extend(self._create_array(k))
     
     def insert(self, index, value):
         """Insert value at index, shifting elements if necessary."""
         if not 0 <= index <= self.length:
             raise IndexError("Index out of range")
         
+        # Convert first, so a value the typed storage rejects raises before anything moves
+        value = self._as_storage((value,))[0]
+        
         # If array is full, resize
         if self.length == self.capacity:
-            self._resize(2 * self.capacity)
+            self._ensure_capacity(self.length + 1)
         
-        # Shift elements to make room
-        for i in range(self.length, index, -1):
-            self.array[i] = self.array[i-1]
+        # Shift elements one slot to the right with a single in-place move
+        self._shift_right(index, 1)
         
         self.array[index] = value
         self.length += 1
@@ -75,102 +290,1042 @@ class DynamicArray:
         if not 0 <= index < self.length:
             raise IndexError("Index out of range")
         
-        # Shift elements to fill the gap
-        for i in range(index, self.length - 1):
-            self.array[i] = self.array[i+1]
-        
-        self.array[self.length - 1] = None
+        # Shift elements one slot to the left with a single in-place move
+        self._shift_left(index, 1)
         self.length -= 1
         
-        # If array is less than 1/4 full, resize to half
-        if 0 < self.length < self.capacity // 4:
-            self._resize(self.capacity // 2)
+        self._maybe_shrink()
+    
+    def extend(self, values):
+        """
+        Append every element of values to the end of the array.
+        
+        Time Complexity: O(k) amortized for k new elements (at most one resize)
+        """
+        values = self._as_storage(values)
+        k = len(values)
+        self._ensure_capacity(self.length + k)
+        
+        self.array[self.length:self.length + k] = values
+        self.length += k
+    
+    def insert_many(self, index, values):
+        """
+        Insert all of values starting at index, shifting the tail once.
+        
+        Time Complexity: O(n + k) instead of O(n * k) for k single inserts
+        """
+        if not 0 <= index <= self.length:
+            raise IndexError("Index out of range")
+        
+        values = self._as_storage(values)
+        k = len(values)
+        self._ensure_capacity(self.length + k)
+        
+        self._shift_right(index, k)
+        self.array[index:index + k] = values
+        self.length += k
+    
+    def remove_range(self, start, stop):
+        """
+        Remove the elements in [start, stop), shifting the tail once.
+        
+        Time Complexity: O(n) regardless of how many elements are removed
+        """
+        if not 0 <= start <= stop <= self.length:
+            raise IndexError("Index out of range")
+        
+        k = stop - start
+        if k == 0:
+            return
+        
+        self._shift_left(start, k)
+        self.length -= k
+        
+        self._maybe_shrink()
+    
+    def __str__(self):
+        """Return string representation of the array."""
+        return str([self.array[i] for i in range(self.length)])
+
+
+class GapBuffer:
+    """
+    A sequence with a movable gap of free slots at the last edit position.
+    
+    Inserting or removing at the gap is O(1); moving the gap costs one bulk
+    slice move of the elements in between. Edits that stay in one region,
+    like typing in a text editor, are therefore O(1) amortized regardless of
+    where in the sequence they happen.
+    
+    Layout:  [a b c _ _ _ _ d e]
+                    ^gap_start ^gap_end
+    """
+    
+    def __init__(self, capacity=16):
+        """Initialize an empty buffer whose gap spans the whole capacity."""
+        self._buffer = [None] * max(1, capacity)
+        self._gap_start = 0
+        self._gap_end = len(self._buffer)
+        self.moved = 0  # Elements shifted by gap moves, a measure of edit locality
+    
+    def __len__(self):
+        """Return the number of elements (capacity minus the gap)."""
+        return len(self._buffer) - (self._gap_end - self._gap_start)
+    
+    def _physical(self, index):
+        """Translate a logical index into a position in the buffer."""
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range")
+        if index < self._gap_start:
+            return index
+        return index + self._gap_end - self._gap_start
+    
+    def __getitem__(self, index):
+        """Get item at index."""
+        return self._buffer[self._physical(index)]
+    
+    def __setitem__(self, index, value):
+        """Set item at index to value."""
+        self._buffer[self._physical(index)] = value
+    
+    def _move_gap(self, index):
+        """Move the gap so that it starts at logical position index."""
+        buf, start, end = self._buffer, self._gap_start, self._gap_end
+        if index < start:
+            # Shift buf[index:start] to just before the gap end
+            count = start - index
+            buf[end - count:end] = buf[index:start]
+            new_start, new_end = index, end - count
+            # Clear the vacated slots that are now part of the gap
+            buf[new_start:min(start, new_end)] = [None] * (min(start, new_end) - new_start)
+        elif index > start:
+            # Shift buf[end:end + count] to the gap start
+            count = index - start
+            buf[start:index] = buf[end:end + count]
+            new_start, new_end = index, end + count
+            cleared_from = max(end, new_start)
+            buf[cleared_from:new_end] = [None] * (new_end - cleared_from)
+        else:
+            return
+        self._gap_start, self._gap_end = new_start, new_end
+        self.moved += count
+    
+    def _grow(self):
+        """Double the buffer, widening the gap in place."""
+        extra = len(self._buffer)
+        self._buffer[self._gap_end:self._gap_end] = [None] * extra
+        self._gap_end += extra
+    
+    def insert(self, index, value):
+        """Insert value at index, moving the gap there first."""
+        if not 0 <= index <= len(self):
+            raise IndexError("Index out of range")
+        
+        self._move_gap(index)
+        if self._gap_start == self._gap_end:
+            self._grow()
+        
+        self._buffer[self._gap_start] = value
+        self._gap_start += 1
+    
+    def append(self, value):
+        """Add an element to the end of the buffer."""
+        self.insert(len(self), value)
+    
+    def remove(self, index):
+        """Remove element at index by widening the gap over it."""
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range")
+        
+        self._move_gap(index)
+        self._buffer[self._gap_end] = None
+        self._gap_end += 1
+    
+    def __iter__(self):
+        """Iterate over the elements on both sides of the gap."""
+        yield from itertools.islice(self._buffer, self._gap_start)
+        yield from itertools.islice(self._buffer, self._gap_end, None)
+    
+    def __str__(self):
+        """Return string representation of the buffer."""
+        return str(list(self))
+
+
+class ChunkedList:
+    """
+    A list split into chunks of at most 2 * chunk_size elements, with a
+    Fenwick (binary indexed) tree over the chunk lengths.
+    
+    Finding the chunk that holds an index walks the tree in O(log k) for k
+    chunks, and the edit itself only shifts elements inside one chunk, so
+    insert and remove at random positions cost O(log n + chunk_size)
+    instead of O(n).
+    """
+    
+    def __init__(self, values=(), chunk_size=512):
+        """Initialize the list, optionally loading values in bulk."""
+        self.chunk_size = chunk_size
+        values = list(values)
+        self._chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+        self._length = len(values)
+        self._rebuild_index()
+    
+    def _rebuild_index(self):
+        """Rebuild the Fenwick tree after chunks were split or merged."""
+        tree = [0] + [len(chunk) for chunk in self._chunks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+    
+    def _add_to_index(self, chunk_index, delta):
+        """Record that chunk chunk_index changed length by delta."""
+        i = chunk_index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+    
+    def _locate(self, index):
+        """Return (chunk index, offset in chunk) for a logical index."""
+        pos = 0
+        remaining = index
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            if pos + step < len(self._tree) and self._tree[pos + step] <= remaining:
+                pos += step
+                remaining -= self._tree[pos]
+            step >>= 1
+        return pos, remaining
+    
+    def __len__(self):
+        """Return the number of elements."""
+        return self._length
+    
+    def __getitem__(self, index):
+        """Get item at index."""
+        if not 0 <= index < self._length:
+            raise IndexError("Index out of range")
+        chunk, offset = self._locate(index)
+        return self._chunks[chunk][offset]
+    
+    def __setitem__(self, index, value):
+        """Set item at index to value."""
+        if not 0 <= index < self._length:
+            raise IndexError("Index out of range")
+        chunk, offset = self._locate(index)
+        self._chunks[chunk][offset] = value
+    
+    def insert(self, index, value):
+        """Insert value at index, splitting the chunk if it grows too large."""
+        if not 0 <= index <= self._length:
+            raise IndexError("Index out of range")
+        
+        if not self._chunks:
+            self._chunks.append([value])
+            self._length = 1
+            self._rebuild_index()
+            return
+        
+        if index == self._length:
+            chunk, offset = len(self._chunks) - 1, len(self._chunks[-1])
+        else:
+            chunk, offset = self._locate(index)
+        
+        self._chunks[chunk].insert(offset, value)
+        self._length += 1
+        
+        if len(self._chunks[chunk]) > 2 * self.chunk_size:
+            full = self._chunks[chunk]
+            self._chunks[chunk:chunk + 1] = [full[:self.chunk_size], full[self.chunk_size:]]
+            self._rebuild_index()
+        else:
+            self._add_to_index(chunk, 1)
+    
+    def append(self, value):
+        """Add an element to the end of the list."""
+        self.insert(self._length, value)
+    
+    def remove(self, index):
+        """Remove element at index, merging the chunk into a neighbour if it gets small."""
+        if not 0 <= index < self._length:
+            raise IndexError("Index out of range")
+        
+        chunk, offset = self._locate(index)
+        del self._chunks[chunk][offset]
+        self._length -= 1
+        
+        size = len(self._chunks[chunk])
+        if size == 0:
+            del self._chunks[chunk]
+            self._rebuild_index()
+        elif size < self.chunk_size // 4 and len(self._chunks) > 1:
+            neighbour = chunk - 1 if chunk > 0 else chunk + 1
+            first, second = sorted((chunk, neighbour))
+            self._chunks[first:second + 1] = [self._chunks[first] + self._chunks[second]]
+            self._rebuild_index()
+        else:
+            self._add_to_index(chunk, -1)
+    
+    def __iter__(self):
+        """Iterate over the elements chunk by chunk."""
+        for chunk in self._chunks:
+            yield from chunk
+    
+    def __str__(self):
+        """Return string representation of the list."""
+        return str(list(self))
+
+
+class EditableArray:
+    """
+    A sequence tuned for frequent insertions and removals in the middle.
+    
+    It starts as a GapBuffer, which makes repeated edits in one region O(1).
+    Every SAMPLE_EDITS edits it looks at the median distance between
+    consecutive edit positions. If that exceeds `switch_distance`, the
+    edits jump around, and it converts itself into a ChunkedList, where
+    edits at random positions cost O(log n). If the median later falls to
+    a quarter of `switch_distance`, it converts back to a GapBuffer. The
+    median ignores one-off long jumps, such as the first edit after a run
+    of appends.
+    """
+    
+    SAMPLE_EDITS = 64
+    
+    def __init__(self, switch_distance=512):
+        """Initialize an empty array backed by a gap buffer."""
+        self.switch_distance = switch_distance
+        self._store = GapBuffer()
+        self._distances = []  # Distance of each recent edit from the one before it
+        self._last_edit = None
+    
+    @property
+    def backend(self):
+        """Name of the current storage: 'gap buffer' or 'chunked'."""
+        return "gap buffer" if isinstance(self._store, GapBuffer) else "chunked"
+    
+    def _record_edit(self, index):
+        """Switch storage when the median distance between edits crosses a threshold."""
+        # Repeating the previous position (insert then remove) says nothing
+        # about locality, and counting it would pull the median toward zero.
+        if self._last_edit is not None and index != self._last_edit:
+            self._distances.append(abs(index - self._last_edit))
+        self._last_edit = index
+        if len(self._distances) < self.SAMPLE_EDITS:
+            return
+        
+        median = sorted(self._distances)[len(self._distances) // 2]
+        self._distances.clear()
+        if isinstance(self._store, GapBuffer):
+            if median > self.switch_distance:
+                self._store = ChunkedList(self._store, chunk_size=self.switch_distance)
+        elif median <= self.switch_distance // 4:
+            buffer = GapBuffer(capacity=2 * len(self._store))
+            for value in self._store:
+                buffer.append(value)
+            self._store = buffer
+    
+    def __len__(self):
+        """Return the number of elements."""
+        return len(self._store)
+    
+    def __getitem__(self, index):
+        """Get item at index."""
+        return self._store[index]
+    
+    def __setitem__(self, index, value):
+        """Set item at index to value."""
+        self._store[index] = value
+    
+    def append(self, value):
+        """Add an element to the end of the array."""
+        self._store.append(value)
+    
+    def insert(self, index, value):
+        """Insert value at index."""
+        self._store.insert(index, value)
+        self._record_edit(index)
+    
+    def remove(self, index):
+        """Remove element at index."""
+        self._store.remove(index)
+        self._record_edit(index)
+    
+    def __iter__(self):
+        """Iterate over the elements in order."""
+        return iter(self._store)
+    
+    def __str__(self):
+        """Return string representation of the array."""
+        return str(self._store)
+
+
+class MappedArray(DynamicArray):
+    """
+    A DynamicArray whose storage is a memory-mapped file of fixed-width
+    records, for data sets larger than RAM.
+    
+    The file starts with a 16-byte header (magic, typecode, length) followed
+    by the records, so reopening an existing file is instant: nothing is
+    parsed or loaded until it is read. Capacity grows with the same growth
+    policies as DynamicArray, by extending the file rather than copying.
+    
+    Writes go to the OS page cache and reach the disk lazily; call flush()
+    (or close()) when they must be durable. Slices are zero-copy
+    memoryviews into the file, and must be released before the next resize.
+    
+        with MappedArray("values.bin", typecode="d") as arr:
+            arr.append(3.14)
+    """
+    
+    HEADER = struct.Struct("<4sc3xQ")  # magic, typecode, padding, length
+    MAGIC = b"DYNA"
+    
+    def __init__(self, path, typecode="q", growth=None):
+        """Open the array stored at path, creating the file if needed."""
+        self._mm = None
+        super().__init__(typecode=typecode, growth=growth)
+        self.path = path
+        
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if 0 < size < self.HEADER.size:
+            raise ValueError(f"{path} is too short to be a MappedArray file")
+        exists = size > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            magic, stored_typecode, length = self.HEADER.unpack(self._file.read(self.HEADER.size))
+            if magic != self.MAGIC or stored_typecode.decode() != typecode:
+                self._file.close()
+                raise ValueError(f"{path} is not a MappedArray file with typecode '{typecode}'")
+            capacity = (os.path.getsize(path) - self.HEADER.size) // self._itemsize
+        else:
+            length, capacity = 0, 1
+            self._file.write(self.HEADER.pack(self.MAGIC, typecode.encode(), 0))
+        
+        self._map(max(capacity, 1))
+        self.length = length
+        self.peak_capacity = self.capacity
+    
+    def _map(self, capacity):
+        """Size the file for capacity records and map it into memory."""
+        self._file.truncate(self.HEADER.size + capacity * self._itemsize)
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self.array = memoryview(self._mm)[self.HEADER.size:].cast(self.typecode)
+        self.capacity = capacity
+    
+    def _unmap(self):
+        """Release the mapping; fails if callers still hold slices into it."""
+        self.array.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            # A slice is still alive: keep the mapping and restore our view of it.
+            self.array = memoryview(self._mm)[self.HEADER.size:].cast(self.typecode)
+            raise BufferError("release slices of the MappedArray before it is resized") from None
+        self._mm = None
+    
+    @property
+    def length(self):
+        """Number of elements, stored in the file header."""
+        return self._length
+    
+    @length.setter
+    def length(self, value):
+        self._length = value
+        if self._mm is not None:
+            self.HEADER.pack_into(self._mm, 0, self.MAGIC, self.typecode.encode(), value)
+    
+    def _resize(self, new_capacity):
+        """Grow or shrink the file in place; no elements are copied."""
+        self._unmap()
+        self._map(new_capacity)
+        self.resize_count += 1
+        self.peak_capacity = max(self.peak_capacity, new_capacity)
+    
+    def _shift_right(self, index, k):
+        """Move records right within the fixed-size mapping (a memmove between views)."""
+        self.array[index + k:self.length + k] = self.array[index:self.length]
+    
+    def _shift_left(self, index, k):
+        """Move records left within the fixed-size mapping (a memmove between views)."""
+        self.array[index:self.length - k] = self.array[index + k:self.length]
+    
+    def __getitem__(self, index):
+        """Get item at index, or a zero-copy memoryview for a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            return self.array[start:stop:step]
+        return super().__getitem__(index)
+    
+    def flush(self):
+        """Write dirty pages of the mapping back to the file."""
+        self._mm.flush()
+    
+    def close(self):
+        """Flush and unmap the file. The array cannot be used afterwards."""
+        if self._mm is not None:
+            self.flush()
+            self._unmap()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def linear_search(arr, target):
+    """
+    Search for target in arr using linear search.
+    
+    The scan runs in C wherever possible: list.index for lists and tuples,
+    np.flatnonzero for NumPy arrays and operator.indexOf for any other
+    iterable, instead of indexing arr[i] from a Python loop.
+    
+    Args:
+        arr: List, array or any iterable to search in
+        target: Element to search for
+        
+    Returns:
+        Index of target if found, -1 otherwise
+        
+    Time Complexity: O(n)
+    Space Complexity: O(1), O(n) for the NumPy path
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        hits = np.flatnonzero(arr == target)
+        return int(hits[0]) if len(hits) else -1
+    
+    try:
+        if isinstance(arr, (list, tuple)):
+            return arr.index(target)
+        return operator.indexOf(arr, target)
+    except ValueError:
+        return -1
+
+
+def find_all(arr, target):
+    """
+    Find every index at which target occurs.
+    
+    Args:
+        arr: List, array or any iterable to search in
+        target: Element to search for
+        
+    Returns:
+        List of indices in increasing order (empty if target is absent)
+        
+    Time Complexity: O(n)
+    Space Complexity: O(k) for k matches
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        return np.flatnonzero(arr == target).tolist()
+    
+    if isinstance(arr, (list, tuple)):
+        # Resume list.index after each hit, so the scan itself stays in C
+        indices = []
+        i = -1
+        try:
+            while True:
+                i = arr.index(target, i + 1)
+                indices.append(i)
+        except ValueError:
+            return indices
+    
+    return [i for i, item in enumerate(arr) if item == target]
+
+
+def find_any(arr, targets):
+    """
+    Find the first index whose element is any of targets.
+    
+    The targets are put in a set once, so each element costs one hash
+    lookup no matter how many targets there are.
+    
+    Args:
+        arr: List, array or any iterable to search in
+        targets: Iterable of hashable elements to look for
+        
+    Returns:
+        Index of the first match, or -1 if none of targets occurs
+        
+    Time Complexity: O(n + m) for m targets
+    Space Complexity: O(m)
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        hits = np.flatnonzero(np.isin(arr, list(targets)))
+        return int(hits[0]) if len(hits) else -1
+    
+    wanted = set(targets)
+    for i, item in enumerate(arr):
+        if item in wanted:
+            return i
+    return -1
+
+
+def find_first(iterable, predicate):
+    """
+    Find the first index whose element satisfies predicate, stopping at
+    the first match.
+    
+    Args:
+        iterable: Any iterable, including generators and infinite streams
+        predicate: Function returning True for the element being looked for
+        
+    Returns:
+        Index of the first matching element, or -1 if none matches
+        
+    Time Complexity: O(i) where i is the index of the first match
+    Space Complexity: O(1)
+    """
+    for i, item in enumerate(iterable):
+        if predicate(item):
+            return i
+    return -1
+
+
+def binary_search(arr, target):
+    """
+    Search for target in sorted arr using binary search.
+    
+    Args:
+        arr: Sorted list or array to search in
+        target: Element to search for
+        
+    Returns:
+        Index of target if found, -1 otherwise
+        
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+    left, right = 0, len(arr) - 1
+    
+    while left <= right:
+        mid = (left + right) // 2
+        if arr[mid] == target:
+            return mid
+        elif arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    
+    return -1
+
+
+def _check_sequence(arr):
+    """Reject inputs that cannot be indexed, such as generators or sets."""
+    if not (hasattr(arr, "__getitem__") and hasattr(arr, "__len__")):
+        raise TypeError(
+            f"Expected a sorted sequence, got {type(arr).__name__}; "
+            "convert it with sorted() first")
+
+
+def binary_search_recursive(arr, target, left=None, right=None):
+    """
+    Search for target in sorted arr using recursive binary search.
+    
+    This is the recursive formulation for study; binary_search and
+    search_sorted do the same work iteratively in O(1) space.
+    
+    Args:
+        arr: Sorted list or array to search in
+        target: Element to search for
+        left: Start index (default: 0)
+        right: End index (default: len(arr)-1)
+        
+    Returns:
+        Index of target if found, -1 otherwise
+        
+    Time Complexity: O(log n)
+    Space Complexity: O(log n) due to recursion stack
+    """
+    _check_sequence(arr)
+    if left is None:
+        left = 0
+    if right is None:
+        right = len(arr) - 1
+    
+    def search(left, right):
+        if left > right:
+            return -1
+        
+        mid = (left + right) // 2
+        
+        if arr[mid] == target:
+            return mid
+        elif arr[mid] < target:
+            return search(mid + 1, right)
+        else:
+            return search(left, mid - 1)
+    
+    return search(left, right)
+
+
+def lower_bound(arr, target, lo=0, hi=None):
+    """
+    Find the first index in sorted arr[lo:hi] whose element is >= target.
+    
+    Returns:
+        Insertion point before any elements equal to target (hi if none)
+        
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+    if hi is None:
+        hi = len(arr)
+    
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if arr[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    
+    return lo
+
+
+def upper_bound(arr, target, lo=0, hi=None):
+    """
+    Find the first index in sorted arr[lo:hi] whose element is > target.
+    
+    Returns:
+        Insertion point after any elements equal to target (hi if none)
+        
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+    if hi is None:
+        hi = len(arr)
+    
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if target < arr[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    
+    return lo
+
+
+def first_occurrence(arr, target):
+    """
+    Find the index of the first element equal to target in sorted arr.
+    
+    Returns:
+        Index of the first occurrence, or -1 if not found
+        
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+    _check_sequence(arr)
+    i = lower_bound(arr, target)
+    return i if i < len(arr) and arr[i] == target else -1
+
+
+def last_occurrence(arr, target):
+    """
+    Find the index of the last element equal to target in sorted arr.
+    
+    Returns:
+        Index of the last occurrence, or -1 if not found
+        
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+    _check_sequence(arr)
+    i = upper_bound(arr, target) - 1
+    return i if i >= 0 and arr[i] == target else -1
+
+
+def exponential_search(arr, target):
+    """
+    Search for target in sorted arr by galloping: probe indices 1, 2, 4, 8, ...
+    until one passes target, then binary search inside that last window.
+    
+    Faster than binary search when target sits near the front of a large
+    array, since the cost depends on the target's position i, not on n.
+    
+    Returns:
+        Index of the first occurrence of target, or -1 if not found
+        
+    Time Complexity: O(log i) where i is the position of target
+    Space Complexity: O(1)
+    """
+    _check_sequence(arr)
+    n = len(arr)
+    if n == 0:
+        return -1
+    
+    bound = 1
+    while bound < n and arr[bound] < target:
+        bound *= 2
+    
+    i = lower_bound(arr, target, bound // 2, min(bound + 1, n))
+    return i if i < n and arr[i] == target else -1
+
+
+def interpolation_search(arr, target):
+    """
+    Search for target in sorted numeric arr by estimating its position from
+    the values at the ends of the current range, like looking up a name in
+    a phone book.
+    
+    Falls back to halving once the estimates stop paying off, so skewed
+    data cannot push it past O(log n).
+    
+    Returns:
+        Index of the first occurrence of target, or -1 if not found
+        
+    Time Complexity: O(log log n) for uniformly distributed keys, O(log n) worst case
+    Space Complexity: O(1)
+    """
+    _check_sequence(arr)
+    lo, hi = 0, len(arr) - 1
+    probes_left = 2 * max(1, len(arr).bit_length())
+    
+    while lo <= hi and arr[lo] <= target <= arr[hi]:
+        if arr[lo] == arr[hi] or probes_left <= 0:
+            break
+        probes_left -= 1
+        
+        pos = lo + int((target - arr[lo]) * (hi - lo) / (arr[hi] - arr[lo]))
+        pos = min(max(pos, lo), hi)
+        
+        if arr[pos] < target:
+            lo = pos + 1
+        else:
+            hi = pos
+            if lo == hi:
+                break
+    
+    i = lower_bound(arr, target, lo, max(lo, hi + 1))
+    return i if i < len(arr) and arr[i] == target else -1
+
+
+def _looks_uniform(arr, samples=8, tolerance=0.1):
+    """Check whether a numeric sorted arr grows roughly linearly between its ends."""
+    n = len(arr)
+    first, last = arr[0], arr[n - 1]
+    spread = last - first
+    if spread <= 0:
+        return False
+    for k in range(1, samples):
+        i = k * (n - 1) // samples
+        expected = first + spread * i / (n - 1)
+        if abs(arr[i] - expected) > tolerance * spread:
+            return False
+    return True
+
+
+def choose_search_strategy(arr):
+    """
+    Pick the fastest strategy for searching sorted arr.
     
-    def __str__(self):
-        """Return string representation of the array."""
-        return str([self.array[i] for i in range(self.length)])
+    Returns:
+        'linear' for tiny arrays, 'interpolation' for large numeric arrays
+        whose values look uniformly spread, 'binary' otherwise
+    """
+    n = len(arr)
+    if n <= 16:
+        return "linear"
+    
+    if n >= 1024 and _is_numeric(arr) and _looks_uniform(arr):
+        return "interpolation"
+    return "binary"
 
 
-def linear_search(arr, target):
+def _is_numeric(seq):
     """
-    Search for target in arr using linear search.
+    Check in O(1) whether seq holds plain numbers, from its container type
+    or the types of its end elements. Nothing is converted.
+    """
+    if isinstance(seq, DynamicArray):
+        return seq.typecode is not None
+    if isinstance(seq, array.array):
+        return True
+    if np is not None and isinstance(seq, np.ndarray):
+        return seq.ndim == 1 and seq.dtype.kind in "iuf"
+    return len(seq) > 0 and all(type(seq[i]) in (int, float) for i in (0, -1))
+
+
+def search_sorted(arr, target, strategy=None):
+    """
+    Search sorted arr for target with the strategy best suited to its size
+    and element type (see choose_search_strategy), or the one given.
     
     Args:
-        arr: List or array to search in
+        arr: Sorted sequence to search in
         target: Element to search for
+        strategy: 'linear', 'binary', 'exponential', 'interpolation' or None
         
     Returns:
-        Index of target if found, -1 otherwise
-        
-    Time Complexity: O(n)
-    Space Complexity: O(1)
+        Index of the first occurrence of target, or -1 if not found
     """
-    for i in range(len(arr)):
-        if arr[i] == target:
-            return i
-    return -1
+    _check_sequence(arr)
+    if strategy is None:
+        strategy = choose_search_strategy(arr)
+    
+    if strategy == "linear":
+        for i, item in enumerate(arr):
+            if item == target:
+                return i
+            if target < item:
+                break
+        return -1
+    if strategy == "binary":
+        return first_occurrence(arr, target)
+    if strategy == "exponential":
+        return exponential_search(arr, target)
+    if strategy == "interpolation":
+        return interpolation_search(arr, target)
+    raise ValueError(f"Unknown search strategy: {strategy}")
 
 
-def binary_search(arr, target):
+def _as_numeric_array(seq, copy=False):
     """
-    Search for target in sorted arr using binary search.
+    Return seq as a 1-D numeric NumPy array, or None if NumPy is unavailable
+    or seq does not hold plain numbers.
+    
+    Only containers that already hold a numeric buffer (NumPy arrays,
+    array.array, memoryviews and typed DynamicArrays) are wrapped, without
+    copying. Lists and tuples are converted only with copy=True, which
+    costs O(len(seq)).
+    """
+    if np is None:
+        return None
+    if isinstance(seq, DynamicArray):
+        if seq.typecode is None:
+            return None
+        seq = seq.buffer()
+    if isinstance(seq, (np.ndarray, array.array, memoryview)):
+        result = np.asarray(seq)
+    elif copy and isinstance(seq, (list, tuple)) and _is_numeric(seq):
+        result = np.asarray(seq)
+    else:
+        return None
+    if result.ndim != 1 or result.dtype.kind not in "iuf":
+        return None
+    return result
+
+
+def _is_sorted(seq):
+    """Check whether seq is in non-decreasing order."""
+    return all(seq[i] <= seq[i + 1] for i in range(len(seq) - 1))
+
+
+def _batch_insertion_points(arr, targets, side):
+    """Insertion points of every target in sorted arr (side is 'left' or 'right')."""
+    numeric_arr = _as_numeric_array(arr)
+    numeric_targets = _as_numeric_array(targets, copy=True) if numeric_arr is not None else None
+    if numeric_targets is not None:
+        return np.searchsorted(numeric_arr, numeric_targets, side=side).tolist()
+    
+    targets = list(targets)
+    n, m = len(arr), len(targets)
+    if not _is_sorted(targets):
+        search = bisect.bisect_left if side == "left" else bisect.bisect_right
+        return [search(arr, target) for target in targets]
+    
+    points = []
+    i = 0
+    if m * max(1, n.bit_length()) >= n:
+        # Dense sorted targets: a single merge-style pass over arr, O(n + m)
+        for target in targets:
+            if side == "left":
+                while i < n and arr[i] < target:
+                    i += 1
+            else:
+                while i < n and arr[i] <= target:
+                    i += 1
+            points.append(i)
+    else:
+        # Sparse sorted targets: gallop from where the last search ended, doubling
+        # the step until it passes the target, then bisect inside that bracket.
+        # Each search costs O(log gap) instead of O(log n), O(m log(n / m)) overall.
+        search = bisect.bisect_left if side == "left" else bisect.bisect_right
+        for target in targets:
+            lo, step = i, 1
+            while i + step < n and (arr[i + step] < target if side == "left"
+                                    else arr[i + step] <= target):
+                lo = i + step
+                step *= 2
+            i = search(arr, target, lo, min(i + step, n))
+            points.append(i)
+    return points
+
+
+def batch_bisect_left(arr, targets):
+    """
+    Find the leftmost insertion point of every target in sorted arr.
     
     Args:
         arr: Sorted list or array to search in
-        target: Element to search for
+        targets: Iterable of elements to locate
         
     Returns:
-        Index of target if found, -1 otherwise
+        List where result[i] is the index at which targets[i] would be
+        inserted to keep arr sorted, before any equal elements
         
-    Time Complexity: O(log n)
-    Space Complexity: O(1)
+    Time Complexity: O(m log n), or O(n + m) when targets are sorted
+    Space Complexity: O(m)
     """
-    left, right = 0, len(arr) - 1
-    
-    while left <= right:
-        mid = (left + right) // 2
-        if arr[mid] == target:
-            return mid
-        elif arr[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
-    
-    return -1
+    return _batch_insertion_points(arr, targets, "left")
 
 
-def binary_search_recursive(arr, target, left=None, right=None):
+def batch_bisect_right(arr, targets):
     """
-    Search for target in sorted arr using recursive binary search.
+    Find the rightmost insertion point of every target in sorted arr.
     
     Args:
         arr: Sorted list or array to search in
-        target: Element to search for
-        left: Start index (default: 0)
-        right: End index (default: len(arr)-1)
+        targets: Iterable of elements to locate
         
     Returns:
-        Index of target if found, -1 otherwise
+        List where result[i] is the index at which targets[i] would be
+        inserted to keep arr sorted, after any equal elements
         
-    Time Complexity: O(log n)
-    Space Complexity: O(log n) due to recursion stack
+    Time Complexity: O(m log n), or O(n + m) when targets are sorted
+    Space Complexity: O(m)
     """
-    if left is None:
-        left = 0
-    if right is None:
-        right = len(arr) - 1
+    return _batch_insertion_points(arr, targets, "right")
+
+
+def batch_binary_search(arr, targets):
+    """
+    Search for many targets in sorted arr at once.
     
-    if left > right:
-        return -1
+    Uses NumPy's searchsorted when arr already holds a numeric buffer
+    (NumPy array, array.array or typed DynamicArray), a single
+    merge-style pass when the targets are sorted, and one binary search
+    per target otherwise.
     
-    mid = (left + right) // 2
+    Args:
+        arr: Sorted list or array to search in
+        targets: Iterable of elements to search for
+        
+    Returns:
+        List where result[i] is the index of the first occurrence of
+        targets[i] in arr, or -1 if it is not present
+        
+    Time Complexity: O(m log n), or O(n + m) when targets are sorted
+    Space Complexity: O(m)
+    """
+    numeric_arr = _as_numeric_array(arr)
+    numeric_targets = _as_numeric_array(targets, copy=True) if numeric_arr is not None else None
+    if numeric_targets is not None and len(numeric_arr) > 0:
+        points = np.searchsorted(numeric_arr, numeric_targets, side="left")
+        clipped = np.minimum(points, len(numeric_arr) - 1)
+        found = (points < len(numeric_arr)) & (numeric_arr[clipped] == numeric_targets)
+        return np.where(found, points, -1).tolist()
     
-    if arr[mid] == target:
-        return mid
-    elif arr[mid] < target:
-        return binary_search_recursive(arr, target, mid + 1, right)
-    else:
-        return binary_search_recursive(arr, target, left, mid - 1)
+    targets = list(targets)
+    points = _batch_insertion_points(arr, targets, "left")
+    n = len(arr)
+    return [p if p < n and arr[p] == target else -1
+            for p, target in zip(points, targets)]
 
 
 def two_sum(arr, target):
@@ -198,20 +1353,230 @@ def two_sum(arr, target):
     return None
 
 
-def reverse_array(arr):
+def two_sum_pairs(arr, target, mode="hash"):
+    """
+    Lazily yield every pair of indices whose elements add up to target.
+    
+    Args:
+        arr: Sequence of numbers (must be sorted for mode='sorted')
+        target: Target sum
+        mode: 'hash' - single pass with a value -> indices dict, O(n) space;
+              'sorted' - two pointers over a sorted arr, O(1) extra space
+        
+    Yields:
+        Tuples (i, j) with i < j and arr[i] + arr[j] == target
+        
+    Time Complexity: O(n + p) where p is the number of pairs yielded
+    """
+    if mode == "hash":
+        seen = {}  # Value -> list of indices
+        for i, num in enumerate(arr):
+            for j in seen.get(target - num, ()):
+                yield (j, i)
+            seen.setdefault(num, []).append(i)
+    elif mode == "sorted":
+        lo, hi = 0, len(arr) - 1
+        while lo < hi:
+            total = arr[lo] + arr[hi]
+            if total < target:
+                lo += 1
+            elif total > target:
+                hi -= 1
+            elif arr[lo] == arr[hi]:
+                # Every element in [lo, hi] is equal, so all of them pair up
+                for i in range(lo, hi):
+                    for j in range(i + 1, hi + 1):
+                        yield (i, j)
+                return
+            else:
+                lo_end = lo
+                while arr[lo_end + 1] == arr[lo]:
+                    lo_end += 1
+                hi_start = hi
+                while arr[hi_start - 1] == arr[hi]:
+                    hi_start -= 1
+                for i in range(lo, lo_end + 1):
+                    for j in range(hi_start, hi + 1):
+                        yield (i, j)
+                lo, hi = lo_end + 1, hi_start - 1
+    else:
+        raise ValueError(f"Unknown two-sum mode: {mode}")
+
+
+def two_sum_partitioned(values, target, partitions=64, chunk_size=65536):
+    """
+    Yield every index pair summing to target from a stream too large to
+    hold a dict of.
+    
+    Works like a grace hash join: a first pass spills (index, value) records
+    to temporary partition files keyed on min(value, target - value), so a
+    value and its complement always land in the same partition. Each
+    partition is then solved on its own with a dict, so peak memory is about
+    n / partitions entries plus one chunk of buffered records.
+    
+    Args:
+        values: Any iterable of numbers, e.g. a generator or iter_mmap_values()
+        target: Target sum
+        partitions: Number of partition files
+        chunk_size: Records buffered in memory before spilling to disk
+        
+    Yields:
+        Tuples (i, j) with i < j and values[i] + values[j] == target,
+        grouped by partition rather than in index order
+        
+    Time Complexity: O(n + p), with two sequential passes over the data
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [open(os.path.join(tmp, f"part{p}.bin"), "w+b") for p in range(partitions)]
+        try:
+            buffers = [[] for _ in range(partitions)]
+            buffered = 0
+            
+            def spill():
+                for f, buffer in zip(files, buffers):
+                    if buffer:
+                        pickle.dump(buffer, f, pickle.HIGHEST_PROTOCOL)
+                        buffer.clear()
+            
+            for i, num in enumerate(values):
+                buffers[hash(min(num, target - num)) % partitions].append((i, num))
+                buffered += 1
+                if buffered >= chunk_size:
+                    spill()
+                    buffered = 0
+            spill()
+            
+            for f in files:
+                f.seek(0)
+                seen = {}
+                while True:
+                    try:
+                        chunk = pickle.load(f)
+                    except EOFError:
+                        break
+                    for i, num in chunk:
+                        for j in seen.get(target - num, ()):
+                            yield (j, i)
+                        seen.setdefault(num, []).append(i)
+        finally:
+            for f in files:
+                f.close()
+
+
+def iter_mmap_values(path, typecode="q"):
+    """
+    Stream fixed-width numbers from a binary file through a memory map,
+    without reading the whole file into memory.
+    
+    Args:
+        path: File of packed native-endian values (e.g. written by array.tofile)
+        typecode: struct/array typecode of each record
+        
+    Yields:
+        Each value in the file in order
+    """
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm).cast(typecode)
+        try:
+            yield from view
+        finally:
+            view.release()
+
+
+def k_sum(arr, target, k, mode="sorted"):
+    """
+    Lazily yield every distinct combination of k values from arr that sums to target.
+    
+    Fixes one value at a time and recurses until two remain, which are then
+    found with two pointers (mode='sorted', O(1) extra space) or a set
+    (mode='hash'). A sorted copy is made only if arr is not already sorted.
+    
+    Args:
+        arr: Sequence of numbers
+        target: Target sum
+        k: Number of values per combination (k >= 2)
+        mode: 'sorted' or 'hash' for the final two-value step
+        
+    Yields:
+        Tuples of k values in non-decreasing order, each combination once
+        
+    Time Complexity: O(n^(k-1)), plus O(n log n) if arr has to be sorted
+    """
+    if k < 2:
+        raise ValueError("k must be at least 2")
+    if mode not in ("sorted", "hash"):
+        raise ValueError(f"Unknown k-sum mode: {mode}")
+    if not _is_sorted(arr):
+        arr = sorted(arr)
+    
+    def pairs(start, remaining):
+        if mode == "sorted":
+            lo, hi = start, len(arr) - 1
+            while lo < hi:
+                total = arr[lo] + arr[hi]
+                if total < remaining:
+                    lo += 1
+                elif total > remaining:
+                    hi -= 1
+                else:
+                    yield (arr[lo], arr[hi])
+                    lo += 1
+                    while lo < hi and arr[lo] == arr[lo - 1]:
+                        lo += 1
+                    hi -= 1
+        else:
+            seen = set()
+            emitted = set()
+            for i in range(start, len(arr)):
+                num = arr[i]
+                complement = remaining - num
+                if complement in seen and num not in emitted:
+                    emitted.add(num)
+                    yield (complement, num)
+                seen.add(num)
+    
+    def search(start, k, remaining):
+        if k == 2:
+            yield from pairs(start, remaining)
+            return
+        for i in range(start, len(arr) - k + 1):
+            if i > start and arr[i] == arr[i - 1]:
+                continue
+            for rest in search(i + 1, k - 1, remaining - arr[i]):
+                yield (arr[i],) + rest
+    
+    yield from search(0, k, target)
+
+
+def three_sum(arr, target=0):
+    """
+    Lazily yield every distinct triple of values from arr that sums to target.
+    
+    Time Complexity: O(n^2)
+    Space Complexity: O(1) extra if arr is already sorted
+    """
+    return k_sum(arr, target, 3)
+
+
+def reverse_array(arr, lo=0, hi=None):
     """
-    Reverse an array in-place.
+    Reverse an array in-place, or only the range arr[lo:hi].
     
     Args:
         arr: Array to reverse
+        lo: Start of the range to reverse (default: 0)
+        hi: End of the range, exclusive (default: len(arr))
         
     Returns:
         The reversed array (same object)
         
-    Time Complexity: O(n)
+    Time Complexity: O(hi - lo)
     Space Complexity: O(1)
     """
-    left, right = 0, len(arr) - 1
+    left = lo
+    right = (len(arr) if hi is None else hi) - 1
     
     while left < right:
         arr[left], arr[right] = arr[right], arr[left]
@@ -221,13 +1586,23 @@ def reverse_array(arr):
     return arr
 
 
-def rotate_array(arr, k):
+def rotate_array(arr, k, method="juggling"):
     """
     Rotate array to the right by k steps.
     
+    A collections.deque is rotated with deque.rotate and a NumPy array with
+    np.roll; any other mutable sequence is rotated in place without
+    allocating a copy, using one of:
+    
+    - 'juggling': follow each of the gcd(n, k) cycles of the permutation,
+      moving every element exactly once (n moves)
+    - 'reversal': reverse the whole array, then the first k and the
+      remaining n - k elements (n swaps, i.e. 2n moves)
+    
     Args:
         arr: Array to rotate
-        k: Number of steps to rotate
+        k: Number of steps to rotate (negative rotates left)
+        method: 'juggling' or 'reversal'
         
     Returns:
         The rotated array (same object)
@@ -235,17 +1610,37 @@ def rotate_array(arr, k):
     Time Complexity: O(n)
     Space Complexity: O(1)
     """
-    n = len(arr)
-    k = k % n  # Handle case where k > n
+    if isinstance(arr, deque):
+        arr.rotate(k)
+        return arr
+    if np is not None and isinstance(arr, np.ndarray):
+        arr[...] = np.roll(arr, k)
+        return arr
     
-    # Reverse the entire array
-    reverse_array(arr)
-    
-    # Reverse first k elements
-    reverse_array(arr[:k])
+    n = len(arr)
+    if n == 0:
+        return arr
+    k = k % n  # Handle case where k > n or k < 0
+    if k == 0:
+        return arr
     
-    # Reverse remaining elements
-    reverse_array(arr[k:])
+    if method == "reversal":
+        reverse_array(arr)
+        reverse_array(arr, 0, k)
+        reverse_array(arr, k, n)
+    elif method == "juggling":
+        for start in range(math.gcd(n, k)):
+            carried = arr[start]
+            current = start
+            while True:
+                source = (current - k) % n
+                if source == start:
+                    break
+                arr[current] = arr[source]
+                current = source
+            arr[current] = carried
+    else:
+        raise ValueError(f"Unknown rotation method: {method}")
     
     return arr
 
@@ -254,6 +1649,8 @@ def remove_duplicates(arr):
     """
     Remove duplicates from a sorted array in-place.
     
+    A NumPy array is compacted with a vectorized mask instead of a loop.
+    
     Args:
         arr: Sorted array
         
@@ -261,11 +1658,16 @@ def remove_duplicates(arr):
         Length of the array after removing duplicates
         
     Time Complexity: O(n)
-    Space Complexity: O(1)
+    Space Complexity: O(1), O(n) for the NumPy path
     """
-    if not arr:
+    if len(arr) == 0:
         return 0
     
+    if np is not None and isinstance(arr, np.ndarray):
+        unique = unique_sorted(arr)
+        arr[:len(unique)] = unique
+        return len(unique)
+    
     # i is the index where unique elements should be placed
     i = 0
     
@@ -277,6 +1679,187 @@ def remove_duplicates(arr):
     return i + 1  # Length of unique elements
 
 
+def unique_sorted(arr):
+    """
+    Return the distinct elements of a sorted array, in order.
+    
+    For a NumPy array this keeps every element that differs from its
+    predecessor (a diff mask) in one vectorized step.
+    
+    Args:
+        arr: Sorted array
+        
+    Returns:
+        A new NumPy array for NumPy input, otherwise a list
+        
+    Time Complexity: O(n)
+    Space Complexity: O(n) for the result
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        if len(arr) == 0:
+            return arr.copy()
+        mask = np.empty(len(arr), dtype=bool)
+        mask[0] = True
+        np.not_equal(arr[1:], arr[:-1], out=mask[1:])
+        return arr[mask]
+    return list(dedup_sorted_stream(arr))
+
+
+def dedup_sorted_stream(iterable, key=None):
+    """
+    Lazily drop repeated elements from a sorted (or grouped) stream.
+    
+    Only the previous element is remembered, so an unbounded stream is
+    deduplicated in constant memory.
+    
+    Args:
+        iterable: Sorted iterable; equal elements must be adjacent
+        key: Optional function computing the value compared for equality
+        
+    Yields:
+        The first element of each run of equal elements
+        
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    for _, group in itertools.groupby(iterable, key):
+        yield next(group)
+
+
+def dedup_unsorted(iterable, key=None):
+    """
+    Lazily drop repeated elements from an unsorted stream, keeping the
+    first occurrence of each and preserving order.
+    
+    Args:
+        iterable: Iterable of hashable elements (or elements with a hashable key)
+        key: Optional function computing the value compared for equality
+        
+    Yields:
+        Each distinct element the first time it appears
+        
+    Time Complexity: O(n) average
+    Space Complexity: O(d) for d distinct elements
+    """
+    seen = set()
+    for item in iterable:
+        marker = item if key is None else key(item)
+        if marker not in seen:
+            seen.add(marker)
+            yield item
+
+
+class BloomFilter:
+    """
+    A probabilistic set: membership tests never miss an added item, but may
+    report an item that was never added with probability about error_rate.
+    
+    Memory is fixed up front from the expected number of items, roughly
+    9.6 bits per item for a 1% error rate, regardless of item size.
+    """
+    
+    def __init__(self, capacity, error_rate=0.01):
+        """Size the filter for `capacity` items at the given false positive rate."""
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1")
+        
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, item):
+        """Bit positions for item, using double hashing: h1 + i * h2."""
+        h1 = hash(item)
+        h2 = hash((item, 0x5bd1e995)) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, item):
+        """Add item to the filter."""
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, item):
+        """Return True if item may have been added, False if it definitely was not."""
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+def dedup_approximate(iterable, capacity, error_rate=0.01, key=None):
+    """
+    Lazily drop repeated elements from a stream too large to keep a set of,
+    using a Bloom filter in fixed memory.
+    
+    Never yields a duplicate, but may wrongly drop about error_rate of the
+    distinct elements (Bloom filter false positives).
+    
+    Args:
+        iterable: Iterable of hashable elements (or elements with a hashable key)
+        capacity: Expected number of distinct elements
+        error_rate: Acceptable fraction of distinct elements wrongly dropped
+        key: Optional function computing the value compared for equality
+        
+    Yields:
+        Each element whose key has (probably) not been seen before
+        
+    Time Complexity: O(n * k) for k hash functions
+    Space Complexity: O(capacity * log(1 / error_rate)) bits
+    """
+    seen = BloomFilter(capacity, error_rate)
+    for item in iterable:
+        marker = item if key is None else key(item)
+        if marker not in seen:
+            seen.add(marker)
+            yield item
+
+
+def max_subarray(arr):
+    """
+    Find the contiguous subarray with the largest sum, and where it is.
+    
+    Uses Kadane's algorithm over an iterator (no copy of arr). A NumPy
+    float array is handled with vectorized prefix sums instead: the best
+    subarray ending at j is prefix[j + 1] - min(prefix[:j + 1]).
+    
+    Args:
+        arr: Non-empty array of numbers
+        
+    Returns:
+        Tuple (max_sum, start, end) such that sum(arr[start:end + 1]) == max_sum;
+        (0, 0, -1) for an empty array
+        
+    Time Complexity: O(n)
+    Space Complexity: O(1), O(n) for the NumPy path
+    """
+    if len(arr) == 0:
+        return (0, 0, -1)
+    
+    if np is not None and isinstance(arr, np.ndarray) and arr.dtype.kind == "f":
+        prefix = np.concatenate(([0.0], np.cumsum(arr)))
+        running_min = np.minimum.accumulate(prefix[:-1])
+        gains = prefix[1:] - running_min
+        end = int(np.argmax(gains))
+        start = int(np.argmin(prefix[:end + 1]))
+        return (float(gains[end]), start, end)
+    
+    it = iter(arr)
+    current_sum = max_sum = next(it)
+    current_start = best_start = best_end = 0
+    
+    for i, num in enumerate(it, 1):
+        if current_sum < 0:
+            current_sum = num
+            current_start = i
+        else:
+            current_sum += num
+        if current_sum > max_sum:
+            max_sum = current_sum
+            best_start, best_end = current_start, i
+    
+    return (max_sum, best_start, best_end)
+
+
 def max_subarray_sum(arr):
     """
     Find the contiguous subarray with the largest sum.
@@ -290,16 +1873,122 @@ def max_subarray_sum(arr):
     Time Complexity: O(n)
     Space Complexity: O(1)
     """
-    if not arr:
+    if len(arr) == 0:
         return 0
     
-    current_sum = max_sum = arr[0]
+    return max_subarray(arr)[0]
+
+
+def subarray_summary(arr, offset=0):
+    """
+    Summarize a chunk of a larger array for the divide-and-conquer max subarray.
+    
+    Args:
+        arr: Non-empty chunk of numbers
+        offset: Index of arr[0] in the full array, so bounds are global
+        
+    Returns:
+        Tuple (total, prefix, suffix, best) where
+        prefix = (best prefix sum, its end index),
+        suffix = (best suffix sum, its start index),
+        best = (max subarray sum, start, end)
+        
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    running = 0
+    prefix = None
+    min_before = min_before_at = None  # Smallest sum of the elements before a suffix start
+    
+    for i, num in enumerate(arr, offset):
+        if min_before is None or running < min_before:
+            min_before, min_before_at = running, i
+        running += num
+        if prefix is None or running > prefix[0]:
+            prefix = (running, i)
+    
+    best = max_subarray(arr)
+    best = (best[0], best[1] + offset, best[2] + offset)
+    return (running, prefix, (running - min_before, min_before_at), best)
+
+
+def combine_subarray_summaries(left, right):
+    """
+    Merge the summaries of two adjacent chunks (left comes first) into the
+    summary of their concatenation.
+    
+    Time Complexity: O(1)
+    """
+    l_total, l_prefix, l_suffix, l_best = left
+    r_total, r_prefix, r_suffix, r_best = right
+    
+    total = l_total + r_total
+    
+    prefix = l_prefix
+    if l_total + r_prefix[0] > prefix[0]:
+        prefix = (l_total + r_prefix[0], r_prefix[1])
     
-    for num in arr[1:]:
-        current_sum = max(num, current_sum + num)
-        max_sum = max(max_sum, current_sum)
+    suffix = r_suffix
+    if r_total + l_suffix[0] > suffix[0]:
+        suffix = (r_total + l_suffix[0], l_suffix[1])
     
-    return max_sum
+    best = l_best
+    crossing = l_suffix[0] + r_prefix[0]
+    if crossing > best[0]:
+        best = (crossing, l_suffix[1], r_prefix[1])
+    if r_best[0] > best[0]:
+        best = r_best
+    
+    return (total, prefix, suffix, best)
+
+
+def _summarize_chunk(args):
+    """Process-pool worker: summarize one (chunk, offset) pair."""
+    chunk, offset = args
+    return subarray_summary(chunk, offset)
+
+
+def max_subarray_parallel(arr, workers=None, chunk_size=None):
+    """
+    Find the maximum subarray of a large array across a process pool.
+    
+    The array is split into chunks, each worker summarizes its chunk with
+    subarray_summary, and the summaries are merged left to right with
+    combine_subarray_summaries.
+    
+    Args:
+        arr: Array of numbers
+        workers: Number of worker processes (default: os.cpu_count())
+        chunk_size: Elements per chunk (default: an even split across workers)
+        
+    Returns:
+        Tuple (max_sum, start, end), as for max_subarray
+        
+    Time Complexity: O(n / workers + number of chunks)
+    Space Complexity: O(n) to ship the chunks to the workers
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    n = len(arr)
+    if n == 0:
+        return (0, 0, -1)
+    
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = math.ceil(n / workers)
+    
+    chunks = [(arr[lo:lo + chunk_size], lo) for lo in range(0, n, chunk_size)]
+    if workers == 1 or len(chunks) == 1:
+        summaries = map(_summarize_chunk, chunks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            summaries = list(pool.map(_summarize_chunk, chunks))
+    
+    summaries = iter(summaries)
+    result = next(summaries)
+    for summary in summaries:
+        result = combine_subarray_summaries(result, summary)
+    return result[3]
 
 
 if __name__ == "__main__":
@@ -316,6 +2005,39 @@ if __name__ == "__main__":
     arr.remove(5)
     print(f"After removing element at index 5: {arr}")
     
+    typed = DynamicArray(typecode='d')
+    for i in range(10):
+        typed.append(i * 0.5)
+    print(f"Typed array ('d'): {typed}")
+    print(f"Buffer: {typed.buffer().nbytes} bytes, format '{typed.buffer().format}'")
+    
+    arr.extend([10, 11, 12])
+    arr.insert_many(2, [-1, -2, -3])
+    print(f"After extend and insert_many: {arr}")
+    arr.remove_range(2, 5)
+    print(f"After remove_range(2, 5): {arr}")
+    
+    editable = EditableArray()
+    for i in range(10):
+        editable.append(i)
+    for ch in "abc":
+        editable.insert(5, ch)
+    editable.remove(0)
+    print(f"EditableArray ({editable.backend}): {editable}")
+    
+    path = os.path.join(tempfile.gettempdir(), "mapped_array_demo.bin")
+    with MappedArray(path, typecode="q") as mapped:
+        mapped.extend(range(10))
+    with MappedArray(path, typecode="q") as mapped:
+        print(f"Reopened MappedArray: {mapped}, slice [2:5] -> {mapped[2:5].tolist()}")
+    os.remove(path)
+    
+    for policy in (GeometricGrowth(2), GeometricGrowth(1.5), AdditiveGrowth(256), CPythonGrowth()):
+        grown = DynamicArray(growth=policy)
+        for i in range(10_000):
+            grown.append(i)
+        print(f"{type(policy).__name__}: {grown.resize_stats()}")
+    
     # Test search algorithms
     print("\nTesting search algorithms...")
     test_arr = [1, 3, 5, 7, 9, 11, 13, 15]
@@ -323,10 +2045,24 @@ if __name__ == "__main__":
     
     linear_result = linear_search(test_arr, target)
     print(f"Linear search for {target}: found at index {linear_result}")
+    print(f"find_all(3) in [3, 1, 3, 3]: {find_all([3, 1, 3, 3], 3)}")
+    print(f"find_any({{11, 5}}): {find_any(test_arr, {11, 5})}")
+    print(f"find_first(x > 10): {find_first(test_arr, lambda x: x > 10)}")
     
     binary_result = binary_search(test_arr, target)
     print(f"Binary search for {target}: found at index {binary_result}")
     
+    dupes = [1, 2, 2, 2, 3, 5, 8, 8, 13]
+    print(f"First/last occurrence of 2 in {dupes}: {first_occurrence(dupes, 2)}, {last_occurrence(dupes, 2)}")
+    print(f"Exponential search for 8: {exponential_search(dupes, 8)}")
+    uniform = list(range(0, 20_000, 2))
+    print(f"Strategy for {len(uniform)} evenly spaced ints: {choose_search_strategy(uniform)}")
+    print(f"Search for 1234: {search_sorted(uniform, 1234)}")
+    
+    targets = [0, 3, 8, 13, 20]
+    print(f"Batch binary search for {targets}: {batch_binary_search(test_arr, targets)}")
+    print(f"Insertion points (left) for {targets}: {batch_bisect_left(test_arr, targets)}")
+    
     # Test array operations
     print("\nTesting array operations...")
     test_arr = [1, 2, 3, 4, 5]
@@ -338,6 +2074,10 @@ if __name__ == "__main__":
     rotated_arr = rotate_array(test_arr.copy(), 2)
     print(f"Array rotated by 2: {rotated_arr}")
     
+    rotated_arr = rotate_array(test_arr.copy(), 2, method="reversal")
+    print(f"Array rotated by 2 (reversal): {rotated_arr}")
+    print(f"Deque rotated by 2: {rotate_array(deque(test_arr), 2)}")
+    
     # Test two sum
     print("\nTesting two sum...")
     nums = [2, 7, 11, 15]
@@ -345,8 +2085,27 @@ if __name__ == "__main__":
     result = two_sum(nums, target)
     print(f"Two sum for target {target}: indices {result}")
     
+    nums = [1, 5, 3, 3, 7, 5, 1]
+    print(f"All two-sum pairs for 6 in {nums}: {list(two_sum_pairs(nums, 6))}")
+    print(f"Partitioned (streaming) pairs: {sorted(two_sum_partitioned(iter(nums), 6, partitions=4))}")
+    print(f"Three sum for 0: {list(three_sum([-1, 0, 1, 2, -1, -4]))}")
+    print(f"Four sum for 0: {list(k_sum([1, 0, -1, 0, -2, 2], 0, 4))}")
+    
+    # Test deduplication
+    print("\nTesting deduplication...")
+    nums = [1, 1, 2, 3, 3, 3, 4]
+    length = remove_duplicates(nums)
+    print(f"remove_duplicates: {nums[:length]}")
+    print(f"Sorted stream: {list(dedup_sorted_stream(iter([1, 1, 2, 2, 2, 5])))}")
+    print(f"Unsorted, order preserved: {list(dedup_unsorted([3, 1, 3, 2, 1]))}")
+    print(f"Approximate (Bloom filter): {list(dedup_approximate([3, 1, 3, 2, 1], capacity=100))}")
+    
     # Test max subarray sum
     print("\nTesting max subarray sum...")
     nums = [-2, 1, -3, 4, -1, 2, 1, -5, 4]
     result = max_subarray_sum(nums)
-    print(f"Max subarray sum: {result}")
\ No newline at end of file
+    print(f"Max subarray sum: {result}")
+    
+    best, start, end = max_subarray(nums)
+    print(f"Max subarray: {nums[start:end + 1]} at [{start}, {end}] with sum {best}")
+    print(f"Parallel (2 workers, chunks of 3): {max_subarray_parallel(nums, workers=2, chunk_size=3)}")
\ No newline at end of file
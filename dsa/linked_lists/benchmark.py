@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the linked list implementations.
+
+Run with: python benchmark.py
+"""
+
+import importlib.util
+import os
+import random
+import time
+import timeit
+import tracemalloc
+from contextlib import contextmanager
+
+import implementation as linked_lists
+
+
+def _load_stacks():
+    """Import dsa/stacks/implementation.py under a name that does not clash."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "stacks", "implementation.py")
+    spec = importlib.util.spec_from_file_location("stacks_implementation", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+stacks = _load_stacks()
+
+
+class DictNode:
+    """Node without __slots__, as the node classes used to be."""
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class DictDoublyNode:
+    """Doubly linked node without __slots__, as it used to be."""
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None
+
+
+@contextmanager
+def patched(module, **replacements):
+    """Temporarily replace module-level names, e.g. the node class a list builds."""
+    originals = {name: getattr(module, name) for name in replacements}
+    for name, value in replacements.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(module, name, value)
+
+
+def bytes_per_element(build, n):
+    """Bytes allocated per element while build(n) creates an n-element structure."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    structure = build(n)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return (after - before) / n
+
+
+def build_singly(n):
+    sll = linked_lists.SinglyLinkedList()
+    for _ in range(n):
+        sll.insert_at_beginning(0)
+    return sll
+
+
+def build_doubly(n):
+    dll = linked_lists.DoublyLinkedList()
+    for _ in range(n):
+        dll.insert_at_end(0)
+    return dll
+
+
+def build_stack(cls):
+    def build(n):
+        stack = cls()
+        for _ in range(n):
+            stack.push(0)
+        return stack
+    return build
+
+
+def bench_memory(n):
+    """Print bytes per element before and after slotted nodes, and for the array-backed stack."""
+    rows = []
+    with patched(linked_lists, Node=DictNode):
+        rows.append(("SinglyLinkedList", "dict nodes", bytes_per_element(build_singly, n)))
+    rows.append(("SinglyLinkedList", "slotted nodes", bytes_per_element(build_singly, n)))
+
+    with patched(linked_lists, DoublyNode=DictDoublyNode):
+        rows.append(("DoublyLinkedList", "dict nodes", bytes_per_element(build_doubly, n)))
+    rows.append(("DoublyLinkedList", "slotted nodes", bytes_per_element(build_doubly, n)))
+
+    with patched(stacks, Node=DictNode):
+        rows.append(("LinkedListStack", "dict nodes", bytes_per_element(build_stack(stacks.LinkedListStack), n)))
+    rows.append(("LinkedListStack", "slotted nodes", bytes_per_element(build_stack(stacks.LinkedListStack), n)))
+    rows.append(("ArrayLinkedListStack", "flat array",
+                 bytes_per_element(build_stack(stacks.ArrayLinkedListStack), n)))
+
+    print(f"\nMemory per element (n = {n:,})")
+    for name, variant, size in rows:
+        print(f"{name:>22} {variant:>18}: {size:>7.1f} bytes")
+
+
+def best_time(func, repeat=5):
+    """Best wall time of one call to func, in seconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def bench_unrolled(n, block_size=64):
+    """Compare scans, positional access and memory of SinglyLinkedList and UnrolledLinkedList."""
+    lists = {
+        "SinglyLinkedList": lambda: linked_lists.SinglyLinkedList.from_iterable(range(n)),
+        f"UnrolledLinkedList({block_size})":
+            lambda: linked_lists.UnrolledLinkedList.from_iterable(range(n), block_size=block_size),
+    }
+    operations = [
+        ("search (miss)", lambda lst: lst.search(-1)),
+        ("find_middle", lambda lst: lst.find_middle()),
+        ("get(n - 1)", lambda lst: lst.get(n - 1)),
+        ("sum(iter)", sum),
+    ]
+    
+    print(f"\nSingly vs unrolled linked list (n = {n:,})")
+    print(f"{'operation':>16}" + "".join(f"{name:>26}" for name in lists))
+    built = {name: build() for name, build in lists.items()}
+    for label, operation in operations:
+        row = "".join(f"{best_time(lambda: operation(lst)) * 1e3:>24.2f}ms" for lst in built.values())
+        print(f"{label:>16}{row}")
+    
+    row = "".join(f"{bytes_per_element(lambda _: build(), n):>25.1f}B" for build in lists.values())
+    print(f"{'memory/element':>16}{row}")
+
+
+def copy_sort_rebuild(sll):
+    """What callers did before SinglyLinkedList.sort: copy, sort, allocate a new list."""
+    return linked_lists.SinglyLinkedList.from_iterable(sorted(sll))
+
+
+def time_and_peak(build, operation, repeat=3):
+    """Best time and peak traced memory of operation on a fresh build() each run."""
+    best = float("inf")
+    for _ in range(repeat):
+        structure = build()
+        start = time.perf_counter()
+        operation(structure)
+        best = min(best, time.perf_counter() - start)
+    
+    structure = build()
+    tracemalloc.start()
+    operation(structure)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def bench_sort(n):
+    """Compare the in-place natural merge sort against copy-sort-rebuild."""
+    rng = random.Random(0)
+    shuffled = [rng.randrange(n) for _ in range(n)]
+    nearly_sorted = sorted(shuffled)
+    for _ in range(n // 100):
+        i, j = rng.randrange(n), rng.randrange(n)
+        nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+    inputs = [
+        ("random", shuffled),
+        ("1% swapped", nearly_sorted),
+        ("reversed", sorted(shuffled, reverse=True)),
+    ]
+    methods = [
+        ("sll.sort()", lambda sll: sll.sort()),
+        ("copy-sort-rebuild", copy_sort_rebuild),
+    ]
+    
+    print(f"\nSorting a SinglyLinkedList (n = {n:,})")
+    print(f"{'input':>12} {'method':>18} {'time':>10} {'peak memory':>14}")
+    for label, values in inputs:
+        for name, method in methods:
+            seconds, peak = time_and_peak(
+                lambda: linked_lists.SinglyLinkedList.from_iterable(values), method)
+            print(f"{label:>12} {name:>18} {seconds * 1e3:>8.1f}ms {peak / 2 ** 20:>11.1f}MiB")
+
+
+def palindrome_by_copy(sll):
+    """The copying check: materialize the data and compare with its reverse."""
+    values = list(sll)
+    return values == values[::-1]
+
+
+def intersection_by_set(a, b):
+    """The hashing check: remember every node of a, then walk b."""
+    seen = set()
+    node = a.head
+    while node:
+        seen.add(id(node))
+        node = node.next
+    node = b.head
+    while node and id(node) not in seen:
+        node = node.next
+    return node
+
+
+def build_intersecting(n):
+    """Two lists of about n nodes each whose last n // 2 nodes are shared."""
+    shared = linked_lists.SinglyLinkedList.from_iterable(range(n // 2))
+    a = linked_lists.SinglyLinkedList.from_iterable(range(n - n // 2))
+    b = linked_lists.SinglyLinkedList.from_iterable(range(n - n // 2 + 1))
+    a.tail.next = b.tail.next = shared.head
+    return a, b
+
+
+def bench_checks(n):
+    """Compare the O(1)-memory palindrome and intersection checks with copying versions."""
+    half = list(range(n // 2))
+    palindrome = linked_lists.SinglyLinkedList.from_iterable(half + half[::-1])
+    a, b = build_intersecting(n)
+    cases = [
+        ("is_palindrome", "sll.is_palindrome()", lambda: palindrome.is_palindrome()),
+        ("is_palindrome", "copy to a list", lambda: palindrome_by_copy(palindrome)),
+        ("intersection", "a.intersection(b)", lambda: a.intersection(b)),
+        ("intersection", "set of node ids", lambda: intersection_by_set(a, b)),
+    ]
+    
+    print(f"\nPalindrome and intersection checks (n = {n:,})")
+    print(f"{'check':>14} {'method':>20} {'time':>10} {'peak memory':>14}")
+    for check, method, func in cases:
+        seconds, peak = time_and_peak(lambda: None, lambda _: func())
+        print(f"{check:>14} {method:>20} {seconds * 1e3:>8.1f}ms {peak / 2 ** 20:>11.1f}MiB")
+
+
+if __name__ == "__main__":
+    bench_memory(1_000_000)
+    bench_unrolled(1_000_000)
+    bench_sort(200_000)
+    bench_checks(1_000_000)
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+LRU and LFU caches built on DoublyLinkedList node handles.
+
+Both caches keep a dict from key to list node, so every lookup, insert and
+eviction is O(1): the dict finds the node, and the doubly linked list
+relinks it without walking.
+
+Features shared by both:
+- Size-based eviction (maxsize entries) and optional weight-based eviction
+  (maxweight, with a weigher(key, value) function giving each entry's weight)
+- Optional time-to-live, per cache or per entry
+- Hit, miss, eviction and expiration counters
+- The @cached decorator for memoizing functions
+"""
+
+import functools
+import threading
+import time
+
+from implementation import DoublyLinkedList, DoublyNode
+
+
+class _Entry:
+    """Payload of a cache node."""
+    __slots__ = ("key", "value", "weight", "expires", "freq")
+
+    def __init__(self, key, value, weight, expires):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.expires = expires  # Deadline on the cache clock, or None
+        self.freq = 1           # Access count (used by LFUCache)
+
+
+class _BaseCache:
+    """
+    Common bookkeeping for LRUCache and LFUCache.
+
+    Subclasses decide the eviction order by implementing _link, _touch,
+    _unlink and _victim.
+    """
+
+    def __init__(self, maxsize=128, maxweight=None, weigher=None, ttl=None, clock=time.monotonic):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.weigher = weigher
+        self.ttl = ttl
+        self.clock = clock
+
+        self._nodes = {}  # Key -> DoublyNode whose data is an _Entry
+        self._lock = threading.RLock()
+        self.total_weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        """Return the number of entries (including expired ones not yet purged)."""
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        """Check whether key has a live entry, without counting a hit or miss."""
+        with self._lock:
+            node = self._nodes.get(key)
+            return node is not None and not self._expired(node.data)
+
+    def _expired(self, entry):
+        return entry.expires is not None and self.clock() >= entry.expires
+
+    def _remove(self, node):
+        """Drop node from the cache entirely."""
+        self._unlink(node)
+        del self._nodes[node.data.key]
+        self.total_weight -= node.data.weight
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for key, or default on a miss.
+
+        Expired entries are removed and count as misses.
+        """
+        with self._lock:
+            node = self._nodes.get(key)
+            if node is not None and self._expired(node.data):
+                self._remove(node)
+                self.expirations += 1
+                node = None
+
+            if node is None:
+                self.misses += 1
+                return default
+
+            self._touch(node)
+            self.hits += 1
+            return node.data.value
+
+    def put(self, key, value, ttl=None):
+        """
+        Cache value under key, first evicting other entries until it fits
+        within the size and weight limits. A value heavier than maxweight on
+        its own is not cached.
+
+        Args:
+            key: Hashable key
+            value: Value to cache
+            ttl: Seconds until the entry expires (default: the cache's ttl)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else self.clock() + ttl
+        weight = self.weigher(key, value) if self.weigher else 1
+
+        with self._lock:
+            # Take the entry out while making room, so it is never its own victim
+            node = self._nodes.get(key)
+            if node is not None:
+                self._remove(node)
+                entry = node.data
+                entry.value, entry.weight, entry.expires = value, weight, expires
+                entry.freq += 1
+            else:
+                node = DoublyNode(_Entry(key, value, weight, expires))
+
+            if self.maxweight is not None and weight > self.maxweight:
+                return  # Could never fit; do not flush the cache for it
+
+            while self._nodes and (
+                    (self.maxsize is not None and len(self._nodes) >= self.maxsize)
+                    or (self.maxweight is not None and self.total_weight + weight > self.maxweight)):
+                self._remove(self._victim())
+                self.evictions += 1
+
+            self._nodes[key] = node
+            self.total_weight += weight
+            self._link(node)
+
+    def pop(self, key, default=None):
+        """Remove key and return its value, or default if it is not cached."""
+        with self._lock:
+            node = self._nodes.get(key)
+            if node is None:
+                return default
+            self._remove(node)
+            return node.data.value
+
+    def clear(self):
+        """Remove every entry; the statistics are kept."""
+        with self._lock:
+            for node in list(self._nodes.values()):
+                self._remove(node)
+
+    def stats(self):
+        """Return the cache counters as a dict."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._nodes),
+            "weight": self.total_weight,
+        }
+
+
+class LRUCache(_BaseCache):
+    """
+    Least-recently-used cache.
+
+    Entries live in one DoublyLinkedList ordered by recency. A hit moves
+    its node to the front, and eviction removes the tail.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._order = DoublyLinkedList()
+
+    def _link(self, node):
+        self._order.push_front_node(node)
+
+    def _touch(self, node):
+        self._order.move_to_front(node)
+
+    def _unlink(self, node):
+        self._order.unlink(node)
+
+    def _victim(self):
+        return self._order.tail
+
+
+class LFUCache(_BaseCache):
+    """
+    Least-frequently-used cache, with least-recently-used order among
+    entries of equal frequency.
+
+    Each access count has its own DoublyLinkedList of entries. A hit moves
+    the node from the list for count f to the front of the list for f + 1.
+    Eviction takes the tail of the list with the lowest count.
+
+    The lowest count is tracked in O(1) through hits and inserts. Only when
+    pop, expiry or eviction empties the lowest list does it become unknown,
+    and the next eviction before an insert rescans the F distinct counts in
+    O(F).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._by_freq = {}  # Access count -> DoublyLinkedList (only non-empty lists)
+        self._min_freq = None  # Lowest count in _by_freq, or None when unknown
+
+    def _bucket(self, freq):
+        bucket = self._by_freq.get(freq)
+        if bucket is None:
+            bucket = self._by_freq[freq] = DoublyLinkedList()
+        return bucket
+
+    def _link(self, node):
+        freq = node.data.freq
+        self._bucket(freq).push_front_node(node)
+        # 1 is the lowest possible count, so it is the minimum even when that was unknown
+        if (freq == 1 or len(self._by_freq) == 1
+                or (self._min_freq is not None and freq < self._min_freq)):
+            self._min_freq = freq
+
+    def _touch(self, node):
+        freq = node.data.freq
+        bucket = self._by_freq[freq]
+        bucket.unlink(node)
+        if bucket.is_empty():
+            del self._by_freq[freq]
+            if freq == self._min_freq:
+                self._min_freq = freq + 1  # Where node is about to go
+        node.data.freq += 1
+        self._link(node)
+
+    def _unlink(self, node):
+        freq = node.data.freq
+        bucket = self._by_freq[freq]
+        bucket.unlink(node)
+        if bucket.is_empty():
+            del self._by_freq[freq]
+            if freq == self._min_freq:
+                self._min_freq = None  # Found again lazily by _victim
+
+    def _victim(self):
+        if self._min_freq is None:
+            self._min_freq = min(self._by_freq)
+        return self._by_freq[self._min_freq].tail
+
+
+_KWARGS_MARK = object()  # Separates positional from keyword arguments in default keys
+
+
+def cached(cache=None, key=None):
+    """
+    Memoize a function in an LRUCache (or the cache instance given).
+
+    Usage:
+        @cached
+        def lookup(x): ...
+
+        @cached(LRUCache(maxsize=10_000, ttl=60))
+        def validate(record_id, strict=False): ...
+
+    Args:
+        cache: Cache instance to store results in (default: LRUCache())
+        key: Function building the cache key from the call's arguments
+             (default: the positional arguments plus sorted keyword arguments)
+
+    The wrapped function exposes the cache as .cache, so callers can read
+    .cache.stats() or call .cache.clear().
+    """
+    if callable(cache) and not isinstance(cache, _BaseCache):
+        return cached()(cache)  # Used as a bare @cached
+
+    if cache is None:
+        cache = LRUCache()
+    if key is None:
+        def key(*args, **kwargs):
+            if not kwargs:
+                return args
+            return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+    missing = object()
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            result = cache.get(cache_key, missing)
+            if result is missing:
+                result = func(*args, **kwargs)
+                cache.put(cache_key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    print("Testing LRUCache...")
+    lru = LRUCache(maxsize=3)
+    for k in "abc":
+        lru.put(k, k.upper())
+    lru.get("a")          # 'a' becomes most recently used
+    lru.put("d", "D")     # Evicts 'b', the least recently used
+    print(f"Keys after evicting: {[k for k in 'abcd' if k in lru]}")
+    print(f"Stats: {lru.stats()}")
+
+    print("\nTesting LFUCache...")
+    lfu = LFUCache(maxsize=2)
+    lfu.put("x", 1)
+    lfu.put("y", 2)
+    lfu.get("x")
+    lfu.get("x")
+    lfu.put("z", 3)       # Evicts 'y', used least often
+    print(f"Keys after evicting: {[k for k in 'xyz' if k in lfu]}")
+
+    print("\nTesting weight-based eviction...")
+    sized = LRUCache(maxsize=None, maxweight=10, weigher=lambda k, v: len(v))
+    for word in ["alpha", "beta", "gamma"]:
+        sized.put(word, word)
+    print(f"Kept: {[w for w in ['alpha', 'beta', 'gamma'] if w in sized]}, weight {sized.total_weight}")
+
+    print("\nTesting @cached...")
+
+    @cached
+    def slow_square(n):
+        time.sleep(0.01)
+        return n * n
+
+    for n in [2, 3, 2, 2]:
+        slow_square(n)
+    print(f"slow_square stats: {slow_square.cache.stats()}")
@@ -3,8 +3,13 @@
 Implementation of linked list data structures.
 """
 
+import heapq
+import random
+
 class Node:
     """A node in a singly linked list."""
+    __slots__ = ("data", "next")
+    
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -15,6 +20,8 @@ class Node:
 
 class DoublyNode:
     """A node in a doubly linked list."""
+    __slots__ = ("data", "next", "prev")
+    
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -24,13 +31,163 @@ class DoublyNode:
         return f"DoublyNode({self.data})"
 
 
-class SinglyLinkedList:
-    """Singly linked list implementation."""
+class ValueIndexMixin:
+    """
+    Optional value -> set of nodes index shared by the linked list classes.
+    
+    The list sets self._value_index to a dict to enable it (or None to
+    disable it) and calls _index_add/_index_remove whenever it links or
+    unlinks a node.
+    """
+    
+    def _index_add(self, node):
+        """Record node in the value index, if there is one."""
+        if self._value_index is not None:
+            self._value_index.setdefault(node.data, set()).add(node)
+    
+    def _index_remove(self, node):
+        """Drop node from the value index, if there is one."""
+        if self._value_index is not None:
+            nodes = self._value_index[node.data]
+            nodes.discard(node)
+            if not nodes:
+                del self._value_index[node.data]
+    
+    def contains(self, data):
+        """Check whether any node holds data (O(1) with a value index)."""
+        if self._value_index is not None:
+            return data in self._value_index
+        return self.search(data) != -1
+    
+    def find_node(self, data):
+        """
+        Return the first node holding data, or None if there is none.
+        
+        With a value index this is O(1) when data is missing or held by a
+        single node; duplicates still need the walk, so that the result is
+        the same first node whether or not the index is enabled.
+        """
+        if self._value_index is not None:
+            nodes = self._value_index.get(data)
+            if not nodes:
+                return None
+            if len(nodes) == 1:
+                return next(iter(nodes))
+        
+        current = self.head
+        while current:
+            if current.data == data:
+                return current
+            current = current.next
+        return None
+
+
+class LinkedListMixin:
+    """
+    Operations shared by the linked list classes.
+    
+    They are written against two hooks each list class defines: _node_at,
+    which reaches a valid position (walking from head, descending the
+    express lanes, or walking from the nearer end), and _reverse_after,
+    which reverses a run of nodes in place by relinking them.
+    UnrolledLinkedList, which has no per-element nodes, shares only clear
+    and __contains__ and overrides the rest.
+    """
+    
+    def clear(self):
+        """Remove every node in O(1), detaching the chain without walking it."""
+        self.head = None
+        self.tail = None
+        self.size = 0
+        if self._value_index is not None:
+            self._value_index.clear()
+    
+    def __contains__(self, data):
+        """Support `data in lst` (O(1) with a value index)."""
+        return self.contains(data)
+    
+    def islice(self, start=0, stop=None, step=1):
+        """
+        Lazily yield the data at positions start, start + step, ... below stop,
+        like itertools.islice but reaching start through _node_at.
+        """
+        if start < 0 or (stop is not None and stop < 0) or step < 1:
+            raise ValueError("islice needs start, stop >= 0 and step >= 1")
+        
+        stop = self.size if stop is None else min(stop, self.size)
+        if start >= stop:
+            return
+        
+        current = self._node_at(start)
+        for position in range(start, stop):
+            if (position - start) % step == 0:
+                yield current.data
+            current = current.next
+    
+    def reverse_range(self, i, j):
+        """
+        Reverse the nodes at positions i to j - 1 in place by relinking them.
+        
+        Time Complexity: O(j - i) plus the cost of _node_at(i - 1)
+        Space Complexity: O(1)
+        """
+        if i < 0 or j > self.size or i > j:
+            raise IndexError("Position out of bounds")
+        if j - i < 2:
+            return
+        
+        prev = self._node_at(i - 1) if i > 0 else None
+        self._reverse_after(prev, j - i)
+    
+    def reverse_in_groups(self, k):
+        """
+        Reverse every consecutive group of k nodes in place, including a
+        shorter final group, by relinking them.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+        if k < 1:
+            raise ValueError("Group size must be at least 1")
+        
+        prev = None
+        for start in range(0, self.size, k):
+            prev = self._reverse_after(prev, min(k, self.size - start))
+
+
+class SinglyLinkedList(ValueIndexMixin, LinkedListMixin):
+    """
+    Singly linked list implementation.
     
-    def __init__(self):
+    A tail pointer is kept alongside head, so appending is O(1) and building
+    a list of n elements is O(n) rather than O(n^2).
+    
+    With value_index=True the list also keeps a dict from each value to the
+    set of nodes holding it, updated by every insert and delete, so contains
+    is O(1), find_node is O(1) for a value held by a single node, and search
+    returns -1 for a missing value in O(1). Values must then be hashable.
+    
+    Setting guarded = True (on the class or an instance) makes iteration,
+    search and __str__ walk at most size nodes, so a chain corrupted into a
+    cycle by outside relinking raises RuntimeError (or is marked in __str__)
+    instead of looping forever.
+    """
+    
+    guarded = False
+    
+    def __init__(self, value_index=False):
         """Initialize an empty linked list."""
         self.head = None
+        self.tail = None
         self.size = 0
+        self._value_index = {} if value_index else None
+    
+    @classmethod
+    def from_iterable(cls, iterable, value_index=False):
+        """Build a linked list from an iterable in a single pass."""
+        sll = cls(value_index=value_index)
+        sll.extend(iterable)
+        return sll
     
     def is_empty(self):
         """Check if the list is empty."""
@@ -41,22 +198,47 @@ class SinglyLinkedList:
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self._index_add(new_node)
         self.size += 1
     
     def insert_at_end(self, data):
         """Insert a new node at the end of the list."""
         new_node = Node(data)
+        self._index_add(new_node)
         
         if self.is_empty():
             self.head = new_node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
         
+        self.tail = new_node
         self.size += 1
     
+    def extend(self, iterable):
+        """Append every element of iterable, linking the new nodes in one pass."""
+        dummy = Node(None)
+        last = dummy
+        count = 0
+        
+        for data in iterable:
+            last.next = Node(data)
+            last = last.next
+            self._index_add(last)
+            count += 1
+        
+        if count == 0:
+            return
+        
+        if self.is_empty():
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        
+        self.tail = last
+        self.size += count
+    
     def insert_at_position(self, data, position):
         """Insert a new node at the specified position."""
         if position < 0 or position > self.size:
@@ -66,7 +248,12 @@ class SinglyLinkedList:
             self.insert_at_beginning(data)
             return
         
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+        
         new_node = Node(data)
+        self._index_add(new_node)
         current = self.head
         
         for _ in range(position - 1):
@@ -82,18 +269,27 @@ class SinglyLinkedList:
             raise Exception("List is empty")
         
         data = self.head.data
+        self._index_remove(self.head)
         self.head = self.head.next
+        if self.head is None:
+            self.tail = None
         self.size -= 1
         return data
     
     def delete_at_end(self):
-        """Delete the node at the end of the list."""
+        """
+        Delete the node at the end of the list.
+        
+        Still O(n): the tail pointer cannot reach its predecessor, which
+        has to become the new tail.
+        """
         if self.is_empty():
             raise Exception("List is empty")
         
         if self.head.next is None:
             data = self.head.data
-            self.head = None
+            self._index_remove(self.head)
+            self.head = self.tail = None
             self.size -= 1
             return data
         
@@ -102,7 +298,9 @@ class SinglyLinkedList:
             current = current.next
         
         data = current.next.data
+        self._index_remove(current.next)
         current.next = None
+        self.tail = current
         self.size -= 1
         return data
     
@@ -122,105 +320,1052 @@ class SinglyLinkedList:
             current = current.next
         
         data = current.next.data
+        self._index_remove(current.next)
         current.next = current.next.next
+        if current.next is None:
+            self.tail = current
         self.size -= 1
         return data
     
     def search(self, data):
         """Search for a node with the specified data."""
-        current = self.head
-        position = 0
+        if self._value_index is not None and data not in self._value_index:
+            return -1  # Not found, without walking the list
         
-        while current:
-            if current.data == data:
+        for position, value in enumerate(self):
+            if value == data:
                 return position
-            current = current.next
-            position += 1
         
         return -1  # Not found
     
+    def delete_value(self, data):
+        """
+        Delete the first node holding data.
+        
+        Returns:
+            True if a node was deleted, False if data was not found
+        """
+        position = self.search(data)
+        if position == -1:
+            return False
+        self.delete_at_position(position)
+        return True
+    
+    def _node_at(self, position):
+        """Return the node at a valid position by walking from head."""
+        current = self.head
+        for _ in range(position):
+            current = current.next
+        return current
+    
     def get(self, position):
         """Get the data at the specified position."""
         if position < 0 or position >= self.size:
             raise IndexError("Position out of bounds")
         
+        return self._node_at(position).data
+    
+    def reverse(self):
+        """Reverse the linked list in-place."""
+        prev = None
+        current = self.head
+        self.tail = current
+        
+        while current:
+            next_node = current.next
+            current.next = prev
+            prev = current
+            current = next_node
+        
+        self.head = prev
+    
+    def sort(self, key=None):
+        """
+        Sort the list in place with a stable natural merge sort.
+        
+        The existing nodes are relinked, so no node is allocated and the
+        value index stays valid. Already sorted or reversed input takes O(n).
+        
+        Args:
+            key: Function extracting the comparison key from an element (default: the element)
+            
+        Time Complexity: O(n log n)
+        Space Complexity: O(log n)
+        """
+        self.head, self.tail = merge_sort_chain(self.head, key)
+    
+    def concat(self, other):
+        """
+        Move every node of other onto the end of this list, leaving other empty.
+        
+        Nodes are relinked, not copied. O(1), plus O(len(other)) to index the
+        moved nodes when this list keeps a value index.
+        """
+        if other is self:
+            raise ValueError("Cannot concatenate a list onto itself")
+        if other.is_empty():
+            return
+        
+        head, tail, size = other.head, other.tail, other.size
+        other.clear()
+        
+        if self._value_index is not None:
+            current = head
+            while current:
+                self._index_add(current)
+                current = current.next
+        
+        if self.is_empty():
+            self.head = head
+        else:
+            self.tail.next = head
+        self.tail = tail
+        self.size += size
+    
+    def split_at(self, position):
+        """
+        Detach the nodes from position on into a new list of the same class.
+        
+        This list keeps positions 0 to position - 1. Nodes are relinked, not
+        copied: O(position) to reach the cut, plus O(size - position) to move
+        value-index entries.
+        
+        Returns:
+            The new list holding the detached nodes
+        """
+        if position < 0 or position > self.size:
+            raise IndexError("Position out of bounds")
+        
+        rest = type(self)(value_index=self._value_index is not None)
+        if position == self.size:
+            return rest
+        
+        tail = self.tail
+        if position == 0:
+            head = self.head
+            self.head = None
+            self.tail = None
+        else:
+            prev = self._node_at(position - 1)
+            head = prev.next
+            prev.next = None
+            self.tail = prev
+        
+        current = head
+        while current and self._value_index is not None:
+            self._index_remove(current)
+            rest._index_add(current)
+            current = current.next
+        
+        rest.head, rest.tail = head, tail
+        rest.size = self.size - position
+        self.size = position
+        return rest
+    
+    def _reverse_after(self, prev, count):
+        """
+        Reverse the count >= 1 nodes after prev (from head when prev is None).
+        
+        Returns:
+            The node now ending the reversed segment
+        """
+        first = self.head if prev is None else prev.next
+        current, segment = first, None
+        for _ in range(count):
+            following = current.next
+            current.next = segment
+            segment = current
+            current = following
+        
+        first.next = current
+        if prev is None:
+            self.head = segment
+        else:
+            prev.next = segment
+        if current is None:
+            self.tail = first
+        return first
+    
+    def is_palindrome(self):
+        """
+        Check whether the data reads the same forwards and backwards.
+        
+        The second half of the chain is reversed in place, compared against
+        the first half and reversed back, so the list is left exactly as it
+        was (even if a comparison raises) and nothing is allocated.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+        if self.size < 2:
+            return True
+        
+        before = self._node_at((self.size + 1) // 2 - 1)  # Last node of the first half
+        second = _reverse_chain(before.next)
+        try:
+            left, right = self.head, second
+            while right is not None:
+                if left.data != right.data:
+                    return False
+                left, right = left.next, right.next
+            return True
+        finally:
+            before.next = _reverse_chain(second)
+    
+    def intersection(self, other):
+        """
+        Return the first node shared by this list and other, or None.
+        
+        Shared nodes only arise from relinking outside the list methods,
+        which leaves size stale, so both chains are measured by walking
+        them. Chains that end in different nodes cannot meet. Otherwise the
+        longer one first skips its extra nodes, then both advance in step
+        until they reach the same node.
+        
+        Time Complexity: O(n + m)
+        Space Complexity: O(1)
+        """
+        a_length, a_last = _chain_end(self.head)
+        b_length, b_last = _chain_end(other.head)
+        if a_last is not b_last:
+            return None
+        
+        a, b = self.head, other.head
+        for _ in range(a_length - b_length):
+            a = a.next
+        for _ in range(b_length - a_length):
+            b = b.next
+        
+        while a is not b:
+            a, b = a.next, b.next
+        return a
+    
+    def has_cycle(self):
+        """Detect if the linked list has a cycle using Brent's algorithm."""
+        return find_cycle(self.head)[0] is not None
+    
+    def find_cycle(self):
+        """
+        Locate a cycle in the node chain with Brent's algorithm.
+        
+        Returns:
+            (node where the cycle starts, cycle length), or (None, 0) if the
+            chain ends
+        """
+        return find_cycle(self.head)
+    
+    def find_middle(self):
+        """Find the middle node of the linked list."""
+        if not self.head:
+            return None
+        
+        slow = self.head
+        fast = self.head
+        
+        while fast and fast.next:
+            slow = slow.next
+            fast = fast.next.next
+        
+        return slow.data
+    
+    def __len__(self):
+        """Return the size of the linked list."""
+        return self.size
+    
+    def __iter__(self):
+        """Iterate over the data from head to tail without copying the list."""
+        if self.guarded:
+            yield from self._guarded_walk()
+            return
+        
         current = self.head
-        for _ in range(position):
+        while current:
+            yield current.data
+            current = current.next
+    
+    def _guarded_walk(self):
+        """Yield the data of at most size nodes, raising if the chain disagrees with size."""
+        current = self.head
+        for _ in range(self.size):
+            if current is None:
+                raise RuntimeError(f"List is corrupted: the chain ends before size {self.size}")
+            yield current.data
             current = current.next
         
-        return current.data
+        if current is not None:
+            start, length = find_cycle(self.head)
+            if start is not None:
+                raise RuntimeError(f"List is corrupted: cycle of {length} nodes entered at {start!r}")
+            raise RuntimeError(f"List is corrupted: the chain runs past size {self.size}")
+    
+    def __str__(self):
+        """Return a string representation of the linked list."""
+        if not self.guarded:
+            return "[" + " -> ".join(map(str, self)) + "]"
+        
+        parts = []
+        try:
+            for data in self:
+                parts.append(str(data))
+        except RuntimeError as error:
+            parts.append(f"... <{error}>")
+        return "[" + " -> ".join(parts) + "]"
+
+
+class _SkipNode:
+    """An express-lane entry of IndexedSinglyLinkedList."""
+    __slots__ = ("node", "next", "down", "span")
+    
+    def __init__(self, node, down, span=0):
+        self.node = node    # The list Node this entry stands for
+        self.next = None    # Next entry on the same level
+        self.down = down    # Entry one level below (a list Node on level 1)
+        self.span = span    # List positions from this entry to the next one (or to the end)
+
+
+class IndexedSinglyLinkedList(SinglyLinkedList):
+    """
+    Singly linked list with an indexable skip list layered on top.
+    
+    The Node chain and the SinglyLinkedList API are unchanged. Above the
+    chain sit express lanes: each node is promoted to a random number of
+    levels (half of the nodes reach level 1, a quarter level 2, ...) and
+    every express entry records how many positions it skips. A positional
+    lookup descends the lanes, so get, insert_at_position and
+    delete_at_position take O(log n) expected time instead of O(n).
+    
+    Operations that rearrange the chain (reverse, sort, concat, split_at,
+    reverse_range, reverse_in_groups) rebuild the lanes in O(n).
+    """
+    
+    MAX_LEVEL = 32
+    
+    def __init__(self, value_index=False):
+        """Initialize an empty list with empty express lanes."""
+        self._sentinel = Node(None)  # Sits before head at position -1
+        super().__init__(value_index)
+        self._reset_index()
+    
+    @property
+    def head(self):
+        """First node of the list (kept as the sentinel's successor)."""
+        return self._sentinel.next
+    
+    @head.setter
+    def head(self, node):
+        self._sentinel.next = node
+    
+    def _reset_index(self):
+        """Create empty express lanes, one head entry per level."""
+        down = self._sentinel
+        self._lanes = [None]  # _lanes[level] is the head entry of that level
+        for _ in range(self.MAX_LEVEL):
+            down = _SkipNode(self._sentinel, down, self.size + 1)
+            self._lanes.append(down)
+        self._level = 0  # Highest level currently holding entries
+    
+    def _random_level(self):
+        """Number of express levels for a new node: 0 with probability 1/2, 1 with 1/4, ..."""
+        level = 0
+        while level < self.MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+    
+    def _find_predecessors(self, position):
+        """
+        Return, for every level, the last entry before position and its
+        position, plus the list node just before position.
+        """
+        update = [None] * (self.MAX_LEVEL + 1)
+        ranks = [-1] * (self.MAX_LEVEL + 1)
+        for level in range(self.MAX_LEVEL, self._level, -1):
+            update[level] = self._lanes[level]
+        
+        entry = self._lanes[self._level] if self._level else None
+        pos = -1
+        for level in range(self._level, 0, -1):
+            while entry.next is not None and pos + entry.span < position:
+                pos += entry.span
+                entry = entry.next
+            update[level] = entry
+            ranks[level] = pos
+            if level > 1:
+                entry = entry.down
+        
+        node = entry.down if entry is not None else self._sentinel
+        while pos + 1 < position:
+            node = node.next
+            pos += 1
+        return update, ranks, node
+    
+    def _insert(self, data, position):
+        """Link a new node at position and promote it into the express lanes."""
+        update, ranks, prev = self._find_predecessors(position)
+        
+        new_node = Node(data)
+        new_node.next = prev.next
+        prev.next = new_node
+        if new_node.next is None:
+            self.tail = new_node
+        self._index_add(new_node)
+        
+        height = self._random_level()
+        if height > self._level:
+            for level in range(self._level + 1, height + 1):
+                self._lanes[level].next = None
+                self._lanes[level].span = self.size + 1
+            self._level = height
+        
+        down = new_node
+        for level in range(1, self.MAX_LEVEL + 1):
+            pred = update[level]
+            if level <= height:
+                entry = _SkipNode(new_node, down)
+                entry.next = pred.next
+                entry.span = ranks[level] + pred.span + 1 - position
+                pred.next = entry
+                pred.span = position - ranks[level]
+                down = entry
+            elif level <= self._level:
+                pred.span += 1
+            else:
+                break
+        
+        self.size += 1
+    
+    def _delete(self, position):
+        """Unlink the node at position from the chain and every express lane."""
+        update, _, prev = self._find_predecessors(position)
+        
+        target = prev.next
+        prev.next = target.next
+        self._index_remove(target)
+        if target.next is None:
+            self.tail = prev if prev is not self._sentinel else None
+        
+        for level in range(1, self._level + 1):
+            pred = update[level]
+            if pred.next is not None and pred.next.node is target:
+                pred.span += pred.next.span - 1
+                pred.next = pred.next.next
+            else:
+                pred.span -= 1
+        
+        self.size -= 1
+        return target.data
+    
+    def _rebuild_index(self):
+        """Rebuild all express lanes from the node chain in O(n)."""
+        self._reset_index()
+        last = list(self._lanes)
+        last_pos = [-1] * (self.MAX_LEVEL + 1)
+        
+        node, pos = self.head, 0
+        while node:
+            height = self._random_level()
+            self._level = max(self._level, height)
+            down = node
+            for level in range(1, height + 1):
+                entry = _SkipNode(node, down)
+                last[level].next = entry
+                last[level].span = pos - last_pos[level]
+                last[level], last_pos[level] = entry, pos
+                down = entry
+            node, pos = node.next, pos + 1
+        
+        for level in range(1, self.MAX_LEVEL + 1):
+            last[level].span = self.size - last_pos[level]
+    
+    def insert_at_beginning(self, data):
+        """Insert a new node at the beginning of the list."""
+        self._insert(data, 0)
+    
+    def insert_at_end(self, data):
+        """Insert a new node at the end of the list."""
+        self._insert(data, self.size)
+    
+    def extend(self, iterable):
+        """Append every element of iterable."""
+        for data in iterable:
+            self._insert(data, self.size)
+    
+    def insert_at_position(self, data, position):
+        """Insert a new node at the specified position in O(log n)."""
+        if position < 0 or position > self.size:
+            raise IndexError("Position out of bounds")
+        self._insert(data, position)
+    
+    def delete_at_beginning(self):
+        """Delete the node at the beginning of the list."""
+        if self.is_empty():
+            raise Exception("List is empty")
+        return self._delete(0)
+    
+    def delete_at_end(self):
+        """Delete the node at the end of the list in O(log n)."""
+        if self.is_empty():
+            raise Exception("List is empty")
+        return self._delete(self.size - 1)
+    
+    def delete_at_position(self, position):
+        """Delete the node at the specified position in O(log n)."""
+        if self.is_empty():
+            raise Exception("List is empty")
+        if position < 0 or position >= self.size:
+            raise IndexError("Position out of bounds")
+        return self._delete(position)
+    
+    def _node_at(self, position):
+        """Return the node at a valid position in O(log n)."""
+        _, _, prev = self._find_predecessors(position)
+        return prev.next
+    
+    def get(self, position):
+        """Get the data at the specified position in O(log n)."""
+        if position < 0 or position >= self.size:
+            raise IndexError("Position out of bounds")
+        return self._node_at(position).data
+    
+    def reverse(self):
+        """Reverse the linked list in-place and rebuild the express lanes."""
+        super().reverse()
+        self._rebuild_index()
+    
+    def sort(self, key=None):
+        """Sort the linked list in-place and rebuild the express lanes."""
+        super().sort(key)
+        self._rebuild_index()
+    
+    def clear(self):
+        """Remove every node and reset the express lanes."""
+        super().clear()
+        self._reset_index()
+    
+    def concat(self, other):
+        """Move other's nodes onto the end of this list and rebuild the express lanes."""
+        super().concat(other)
+        self._rebuild_index()
+    
+    def split_at(self, position):
+        """Detach the nodes from position on, rebuilding the lanes of both lists."""
+        rest = super().split_at(position)
+        self._rebuild_index()
+        rest._rebuild_index()
+        return rest
+    
+    def reverse_range(self, i, j):
+        """Reverse positions i to j - 1 in-place and rebuild the express lanes."""
+        super().reverse_range(i, j)
+        self._rebuild_index()
+    
+    def reverse_in_groups(self, k):
+        """Reverse every group of k nodes in-place and rebuild the express lanes."""
+        super().reverse_in_groups(k)
+        self._rebuild_index()
+
+
+class _Block:
+    """A node of an UnrolledLinkedList, holding up to block_size elements."""
+    __slots__ = ("items", "next")
+    
+    def __init__(self, items=None):
+        self.items = [] if items is None else items
+        self.next = None
+    
+    def __repr__(self):
+        return f"_Block({self.items})"
+
+
+class UnrolledLinkedList(LinkedListMixin):
+    """
+    Unrolled linked list: a singly linked list of blocks, each storing up to
+    block_size elements in a contiguous Python list.
+    
+    A scan dereferences one block per block_size elements and searches each
+    block with C-level list operations, and positional access skips whole
+    blocks, so search, get and find_middle are O(n / block_size) node hops
+    instead of O(n). Every block but the tail stays at least half full: an
+    insert into a full block splits it in two, and a delete that leaves a
+    block under half full borrows from or merges with the next block.
+    
+    It has the same API as SinglyLinkedList, except find_node, since
+    elements do not have nodes of their own. With value_index=True it keeps
+    a count per value, so contains is O(1) and search rejects missing values
+    in O(1).
+    """
+    
+    def __init__(self, value_index=False, block_size=64):
+        """Initialize an empty list whose blocks hold up to block_size elements."""
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2")
+        self.block_size = block_size
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self._value_index = {} if value_index else None  # Value -> number of copies
+    
+    @classmethod
+    def from_iterable(cls, iterable, value_index=False, block_size=64):
+        """Build an unrolled list from an iterable, packing the blocks full."""
+        ull = cls(value_index=value_index, block_size=block_size)
+        ull.extend(iterable)
+        return ull
+    
+    def _index_add(self, data):
+        if self._value_index is not None:
+            self._value_index[data] = self._value_index.get(data, 0) + 1
+    
+    def _index_remove(self, data):
+        if self._value_index is not None:
+            count = self._value_index[data] - 1
+            if count:
+                self._value_index[data] = count
+            else:
+                del self._value_index[data]
+    
+    def _locate(self, position):
+        """
+        Find a valid position.
+        
+        Returns:
+            (previous block or None, block, offset within the block)
+        """
+        prev, block = None, self.head
+        while position >= len(block.items):
+            position -= len(block.items)
+            prev, block = block, block.next
+        return prev, block, position
+    
+    def _insert_into(self, block, offset, data):
+        """Insert data into block, splitting the block in half if it overflows."""
+        block.items.insert(offset, data)
+        if len(block.items) > self.block_size:
+            half = len(block.items) // 2
+            new_block = _Block(block.items[half:])
+            del block.items[half:]
+            new_block.next = block.next
+            block.next = new_block
+            if self.tail is block:
+                self.tail = new_block
+        self._index_add(data)
+        self.size += 1
+    
+    def _rebalance(self, prev, block):
+        """Restore the half-full invariant after an element was removed from block."""
+        following = block.next
+        if following is None:
+            if not block.items:  # Unlink the emptied tail block
+                if prev is None:
+                    self.head = self.tail = None
+                else:
+                    prev.next = None
+                    self.tail = prev
+            return
+        
+        minimum = self.block_size // 2
+        if len(block.items) >= minimum:
+            return
+        
+        if len(block.items) + len(following.items) <= self.block_size:
+            block.items.extend(following.items)
+            block.next = following.next
+            if self.tail is following:
+                self.tail = block
+        else:
+            need = minimum - len(block.items)
+            block.items.extend(following.items[:need])
+            del following.items[:need]
+    
+    def is_empty(self):
+        """Check if the list is empty."""
+        return self.head is None
+    
+    def insert_at_beginning(self, data):
+        """Insert an element at the beginning of the list."""
+        if self.is_empty():
+            self.insert_at_end(data)
+        else:
+            self._insert_into(self.head, 0, data)
+    
+    def insert_at_end(self, data):
+        """Insert an element at the end of the list, starting a new block when the tail is full."""
+        if self.tail is None or len(self.tail.items) >= self.block_size:
+            block = _Block()
+            if self.tail is None:
+                self.head = block
+            else:
+                self.tail.next = block
+            self.tail = block
+        
+        self.tail.items.append(data)
+        self._index_add(data)
+        self.size += 1
+    
+    def extend(self, iterable):
+        """Append every element of iterable, filling the tail and then whole blocks."""
+        values = list(iterable)
+        if not values:
+            return
+        
+        for data in values:
+            self._index_add(data)
+        
+        start = 0
+        if self.tail is not None:
+            start = self.block_size - len(self.tail.items)
+            self.tail.items.extend(values[:start])
+        
+        for i in range(start, len(values), self.block_size):
+            block = _Block(values[i:i + self.block_size])
+            if self.tail is None:
+                self.head = block
+            else:
+                self.tail.next = block
+            self.tail = block
+        
+        self.size += len(values)
+    
+    def insert_at_position(self, data, position):
+        """Insert an element at the specified position."""
+        if position < 0 or position > self.size:
+            raise IndexError("Position out of bounds")
+        
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+        
+        _, block, offset = self._locate(position)
+        self._insert_into(block, offset, data)
+    
+    def delete_at_beginning(self):
+        """Delete the element at the beginning of the list."""
+        if self.is_empty():
+            raise Exception("List is empty")
+        return self.delete_at_position(0)
+    
+    def delete_at_end(self):
+        """
+        Delete the element at the end of the list.
+        
+        O(1) unless the tail block empties, in which case its predecessor
+        is found with an O(n / block_size) walk.
+        """
+        if self.is_empty():
+            raise Exception("List is empty")
+        
+        prev = None
+        if len(self.tail.items) == 1 and self.head is not self.tail:
+            prev = self.head
+            while prev.next is not self.tail:
+                prev = prev.next
+        
+        block = self.tail
+        data = block.items.pop()
+        self._index_remove(data)
+        self.size -= 1
+        self._rebalance(prev, block)
+        return data
+    
+    def delete_at_position(self, position):
+        """Delete the element at the specified position."""
+        if self.is_empty():
+            raise Exception("List is empty")
+        
+        if position < 0 or position >= self.size:
+            raise IndexError("Position out of bounds")
+        
+        prev, block, offset = self._locate(position)
+        data = block.items.pop(offset)
+        self._index_remove(data)
+        self.size -= 1
+        self._rebalance(prev, block)
+        return data
+    
+    def search(self, data):
+        """Search for data, returning its first position or -1."""
+        if self._value_index is not None and data not in self._value_index:
+            return -1  # Not found, without walking the list
+        
+        block = self.head
+        position = 0
+        
+        while block:
+            if data in block.items:
+                return position + block.items.index(data)
+            position += len(block.items)
+            block = block.next
+        
+        return -1  # Not found
+    
+    def contains(self, data):
+        """Check whether the list holds data (O(1) with a value index)."""
+        if self._value_index is not None:
+            return data in self._value_index
+        return self.search(data) != -1
+    
+    def delete_value(self, data):
+        """
+        Delete the first occurrence of data.
+        
+        Returns:
+            True if an element was deleted, False if data was not found
+        """
+        if self._value_index is not None and data not in self._value_index:
+            return False
+        
+        prev, block = None, self.head
+        while block:
+            if data in block.items:
+                block.items.remove(data)
+                self._index_remove(data)
+                self.size -= 1
+                self._rebalance(prev, block)
+                return True
+            prev, block = block, block.next
+        
+        return False
+    
+    def get(self, position):
+        """Get the element at the specified position in O(n / block_size)."""
+        if position < 0 or position >= self.size:
+            raise IndexError("Position out of bounds")
+        
+        _, block, offset = self._locate(position)
+        return block.items[offset]
     
     def reverse(self):
-        """Reverse the linked list in-place."""
+        """Reverse the list in-place by reversing the block chain and each block."""
         prev = None
         current = self.head
+        self.tail = current
         
         while current:
-            next_node = current.next
+            current.items.reverse()
+            next_block = current.next
             current.next = prev
             prev = current
-            current = next_node
+            current = next_block
         
         self.head = prev
+        if self.head is not None:
+            self._rebalance(None, self.head)  # The old tail may be under half full
     
-    def has_cycle(self):
-        """Detect if the linked list has a cycle using Floyd's algorithm."""
-        if not self.head or not self.head.next:
-            return False
+    def sort(self, key=None):
+        """
+        Sort the list in place, stably, keeping the block layout.
         
-        slow = self.head
-        fast = self.head
+        The elements are sorted with list.sort and written back block by
+        block, so no block is allocated.
+        """
+        values = list(self)
+        values.sort(key=key)
+        block = self.head
+        start = 0
+        while block:
+            end = start + len(block.items)
+            block.items[:] = values[start:end]
+            start = end
+            block = block.next
+    
+    def _overwrite(self, start, values):
+        """Replace the elements from position start on with values, block by block."""
+        _, block, offset = self._locate(start)
+        done = 0
+        while done < len(values):
+            count = min(len(block.items) - offset, len(values) - done)
+            block.items[offset:offset + count] = values[done:done + count]
+            done += count
+            block, offset = block.next, 0
+    
+    def concat(self, other):
+        """
+        Move every block of other onto the end of this list, leaving other empty.
+        
+        Blocks are relinked, not copied; only the old tail block may take a
+        few elements from the next block to stay half full. O(1), plus
+        O(len(other)) to count the moved values when this list keeps a value
+        index. A list with a different block_size is copied block by block.
+        """
+        if other is self:
+            raise ValueError("Cannot concatenate a list onto itself")
+        if other.is_empty():
+            return
+        if other.block_size != self.block_size:
+            self.extend(other)
+            other.clear()
+            return
+        
+        head, tail, size = other.head, other.tail, other.size
+        other.clear()
+        
+        if self._value_index is not None:
+            block = head
+            while block:
+                for data in block.items:
+                    self._index_add(data)
+                block = block.next
+        
+        old_tail = self.tail
+        if old_tail is None:
+            self.head = head
+        else:
+            old_tail.next = head
+        self.tail = tail
+        self.size += size
+        if old_tail is not None:
+            self._rebalance(None, old_tail)
+    
+    def split_at(self, position):
+        """
+        Detach the elements from position on into a new UnrolledLinkedList.
+        
+        Whole blocks are relinked; only the block holding the cut is split.
+        O(position / block_size), plus O(size - position) to move value counts.
+        
+        Returns:
+            The new list holding the detached elements
+        """
+        if position < 0 or position > self.size:
+            raise IndexError("Position out of bounds")
+        
+        rest = type(self)(value_index=self._value_index is not None, block_size=self.block_size)
+        if position == self.size:
+            return rest
+        
+        prev, block, offset = self._locate(position)
+        tail = self.tail
+        if offset:
+            head = _Block(block.items[offset:])
+            head.next = block.next
+            del block.items[offset:]
+            block.next = None
+            self.tail = block
+            if tail is block:
+                tail = head
+        else:
+            head = block
+            if prev is None:
+                self.head = None
+            else:
+                prev.next = None
+            self.tail = prev
+        
+        rest.head, rest.tail = head, tail
+        rest.size = self.size - position
+        self.size = position
+        if self._value_index is not None:
+            for data in rest:
+                self._index_remove(data)
+                rest._index_add(data)
+        rest._rebalance(None, head)  # The split block may be under half full
+        return rest
+    
+    def reverse_range(self, i, j):
+        """
+        Reverse the elements at positions i to j - 1 in place.
+        
+        Elements already sit in arrays, so they are moved within the blocks
+        rather than relinked.
+        """
+        if i < 0 or j > self.size or i > j:
+            raise IndexError("Position out of bounds")
+        if j - i < 2:
+            return
+        
+        values = list(self.islice(i, j))
+        values.reverse()
+        self._overwrite(i, values)
+    
+    def reverse_in_groups(self, k):
+        """Reverse every consecutive group of k elements in place, including a shorter final group."""
+        if k < 1:
+            raise ValueError("Group size must be at least 1")
+        if self.is_empty():
+            return
+        
+        values = list(self)
+        for start in range(0, len(values), k):
+            values[start:start + k] = values[start:start + k][::-1]
+        self._overwrite(0, values)
+    
+    def has_cycle(self):
+        """Detect a cycle in the block chain using Floyd's algorithm."""
+        slow = fast = self.head
         
         while fast and fast.next:
             slow = slow.next
             fast = fast.next.next
             
-            if slow == fast:
+            if slow is fast:
                 return True
         
         return False
     
     def find_middle(self):
-        """Find the middle node of the linked list."""
-        if not self.head:
+        """Find the middle element (the second one for even sizes), as SinglyLinkedList does."""
+        if self.is_empty():
             return None
-        
-        slow = self.head
-        fast = self.head
-        
-        while fast and fast.next:
-            slow = slow.next
-            fast = fast.next.next
-        
-        return slow.data
+        return self.get(self.size // 2)
     
     def __len__(self):
-        """Return the size of the linked list."""
+        """Return the size of the list."""
         return self.size
     
-    def __str__(self):
-        """Return a string representation of the linked list."""
-        if self.is_empty():
-            return "[]"
-        
-        result = []
-        current = self.head
+    def __iter__(self):
+        """Iterate over the elements from head to tail, one block at a time."""
+        block = self.head
+        while block:
+            yield from block.items
+            block = block.next
+    
+    def islice(self, start=0, stop=None, step=1):
+        """
+        Lazily yield the elements at positions start, start + step, ... below
+        stop, reaching start by skipping whole blocks.
+        """
+        if start < 0 or (stop is not None and stop < 0) or step < 1:
+            raise ValueError("islice needs start, stop >= 0 and step >= 1")
         
-        while current:
-            result.append(str(current.data))
-            current = current.next
+        stop = self.size if stop is None else min(stop, self.size)
+        if start >= stop:
+            return
         
-        return "[" + " -> ".join(result) + "]"
+        _, block, offset = self._locate(start)
+        remaining = stop - start
+        skip = 0  # Elements to skip before the next one to yield
+        while remaining > 0:
+            items = block.items
+            for i in range(offset + skip, min(len(items), offset + remaining), step):
+                yield items[i]
+            taken = min(len(items) - offset, remaining)
+            skip = (skip - taken) % step
+            remaining -= taken
+            block, offset = block.next, 0
+    
+    def __str__(self):
+        """Return a string representation of the list."""
+        return "[" + " -> ".join(map(str, self)) + "]"
 
 
-class DoublyLinkedList:
-    """Doubly linked list implementation."""
+class DoublyLinkedList(ValueIndexMixin, LinkedListMixin):
+    """
+    Doubly linked list implementation.
+    
+    Supports the same opt-in value index as SinglyLinkedList. Because each
+    node knows its predecessor, delete_value is O(1) here when the index is
+    enabled and the value is held by a single node.
+    
+    Callers that keep references to nodes (node handles) can also relink
+    them directly in O(1) with unlink, move_to_front and push_front_node,
+    which is what LRU-style caches need.
+    """
     
-    def __init__(self):
+    def __init__(self, value_index=False):
         """Initialize an empty doubly linked list."""
         self.head = None
         self.tail = None
         self.size = 0
+        self._value_index = {} if value_index else None
     
     def is_empty(self):
         """Check if the list is empty."""
@@ -229,6 +1374,7 @@ class DoublyLinkedList:
     def insert_at_beginning(self, data):
         """Insert a new node at the beginning of the list."""
         new_node = DoublyNode(data)
+        self._index_add(new_node)
         
         if self.is_empty():
             self.head = self.tail = new_node
@@ -242,6 +1388,7 @@ class DoublyLinkedList:
     def insert_at_end(self, data):
         """Insert a new node at the end of the list."""
         new_node = DoublyNode(data)
+        self._index_add(new_node)
         
         if self.is_empty():
             self.head = self.tail = new_node
@@ -266,6 +1413,7 @@ class DoublyLinkedList:
             return
         
         new_node = DoublyNode(data)
+        self._index_add(new_node)
         current = self.head
         
         for _ in range(position - 1):
@@ -284,6 +1432,7 @@ class DoublyLinkedList:
             raise Exception("List is empty")
         
         data = self.head.data
+        self._index_remove(self.head)
         
         if self.head == self.tail:
             self.head = self.tail = None
@@ -300,6 +1449,7 @@ class DoublyLinkedList:
             raise Exception("List is empty")
         
         data = self.tail.data
+        self._index_remove(self.tail)
         
         if self.head == self.tail:
             self.head = self.tail = None
@@ -330,13 +1480,82 @@ class DoublyLinkedList:
         
         current.prev.next = current.next
         current.next.prev = current.prev
+        self._index_remove(current)
         
         data = current.data
         self.size -= 1
         return data
     
+    def _detach(self, node):
+        """Splice node out of the chain, leaving the value index alone."""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        
+        node.prev = node.next = None
+        self.size -= 1
+    
+    def _attach_front(self, node):
+        """Link a detached node in as the new head."""
+        node.prev = None
+        node.next = self.head
+        
+        if self.head:
+            self.head.prev = node
+        else:
+            self.tail = node
+        
+        self.head = node
+        self.size += 1
+    
+    def unlink(self, node):
+        """
+        Remove a node that belongs to this list in O(1).
+        
+        Returns:
+            The detached node, which can be pushed back later
+        """
+        self._detach(node)
+        self._index_remove(node)
+        return node
+    
+    def push_front_node(self, node):
+        """Insert an existing, detached node at the beginning of the list in O(1)."""
+        self._attach_front(node)
+        self._index_add(node)
+        return node
+    
+    def move_to_front(self, node):
+        """Move a node that belongs to this list to the beginning in O(1)."""
+        if node is not self.head:
+            self._detach(node)
+            self._attach_front(node)
+    
+    def delete_value(self, data):
+        """
+        Delete the first node holding data: O(1) with a value index when no
+        other node holds it, otherwise after an O(n) walk.
+        
+        Returns:
+            True if a node was deleted, False if data was not found
+        """
+        node = self.find_node(data)
+        if node is None:
+            return False
+        self.unlink(node)
+        return True
+    
     def search(self, data):
         """Search for a node with the specified data."""
+        if self._value_index is not None and data not in self._value_index:
+            return -1  # Not found, without walking the list
+        
         current = self.head
         position = 0
         
@@ -348,11 +1567,8 @@ class DoublyLinkedList:
         
         return -1  # Not found
     
-    def get(self, position):
-        """Get the data at the specified position."""
-        if position < 0 or position >= self.size:
-            raise IndexError("Position out of bounds")
-        
+    def _node_at(self, position):
+        """Return the node at a valid position, walking from the nearer end."""
         if position < self.size // 2:
             # Start from head
             current = self.head
@@ -364,7 +1580,14 @@ class DoublyLinkedList:
             for _ in range(self.size - 1 - position):
                 current = current.prev
         
-        return current.data
+        return current
+    
+    def get(self, position):
+        """Get the data at the specified position."""
+        if position < 0 or position >= self.size:
+            raise IndexError("Position out of bounds")
+        
+        return self._node_at(position).data
     
     def reverse(self):
         """Reverse the doubly linked list in-place."""
@@ -385,23 +1608,208 @@ class DoublyLinkedList:
                 self.head = current
             current = current.prev
     
+    def sort(self, key=None):
+        """
+        Sort the list in place with a stable natural merge sort.
+        
+        The nodes are relinked through next pointers only, and the prev
+        pointers are restored in one final pass; no node is allocated.
+        
+        Args:
+            key: Function extracting the comparison key from an element (default: the element)
+            
+        Time Complexity: O(n log n)
+        Space Complexity: O(log n)
+        """
+        self.head, self.tail = merge_sort_chain(self.head, key)
+        
+        prev = None
+        current = self.head
+        while current:
+            current.prev = prev
+            prev = current
+            current = current.next
+    
+    def concat(self, other):
+        """
+        Move every node of other onto the end of this list, leaving other empty.
+        
+        Nodes are relinked, not copied. O(1), plus O(len(other)) to index the
+        moved nodes when this list keeps a value index.
+        """
+        if other is self:
+            raise ValueError("Cannot concatenate a list onto itself")
+        if other.is_empty():
+            return
+        
+        head, tail, size = other.head, other.tail, other.size
+        other.clear()
+        
+        if self._value_index is not None:
+            current = head
+            while current:
+                self._index_add(current)
+                current = current.next
+        
+        if self.is_empty():
+            self.head = head
+        else:
+            self.tail.next = head
+            head.prev = self.tail
+        self.tail = tail
+        self.size += size
+    
+    def split_at(self, position):
+        """
+        Detach the nodes from position on into a new DoublyLinkedList.
+        
+        This list keeps positions 0 to position - 1. Nodes are relinked, not
+        copied: the cut is reached from the nearer end, plus O(size - position)
+        to move value-index entries.
+        
+        Returns:
+            The new list holding the detached nodes
+        """
+        if position < 0 or position > self.size:
+            raise IndexError("Position out of bounds")
+        
+        rest = type(self)(value_index=self._value_index is not None)
+        if position == self.size:
+            return rest
+        
+        head, tail = self._node_at(position), self.tail
+        if head.prev is None:
+            self.head = None
+        else:
+            head.prev.next = None
+        self.tail = head.prev
+        head.prev = None
+        
+        current = head
+        while current and self._value_index is not None:
+            self._index_remove(current)
+            rest._index_add(current)
+            current = current.next
+        
+        rest.head, rest.tail = head, tail
+        rest.size = self.size - position
+        self.size = position
+        return rest
+    
+    def _reverse_after(self, prev, count):
+        """
+        Reverse the count >= 1 nodes after prev (from head when prev is None)
+        by swapping their next and prev links.
+        
+        Returns:
+            The node now ending the reversed segment
+        """
+        first = self.head if prev is None else prev.next
+        current = first
+        for _ in range(count):
+            current.next, current.prev = current.prev, current.next
+            segment = current
+            current = current.prev  # The old next
+        
+        segment.prev = prev
+        if prev is None:
+            self.head = segment
+        else:
+            prev.next = segment
+        
+        first.next = current
+        if current is None:
+            self.tail = first
+        else:
+            current.prev = first
+        return first
+    
     def __len__(self):
         """Return the size of the linked list."""
         return self.size
     
-    def __str__(self):
-        """Return a string representation of the linked list."""
-        if self.is_empty():
-            return "[]"
-        
-        result = []
+    def __iter__(self):
+        """Iterate over the data from head to tail without copying the list."""
         current = self.head
-        
         while current:
-            result.append(str(current.data))
+            yield current.data
             current = current.next
+    
+    def __reversed__(self):
+        """Iterate from tail to head, one prev link per step."""
+        current = self.tail
+        while current:
+            yield current.data
+            current = current.prev
+    
+    def __str__(self):
+        """Return a string representation of the linked list."""
+        return "[" + " <-> ".join(map(str, self)) + "]"
+
+
+def find_cycle(head):
+    """
+    Find the cycle in a chain of nodes with Brent's algorithm.
+    
+    The hare walks ahead one node at a time and the tortoise teleports to
+    it at every power of two steps, so the cycle length falls out directly
+    and each step advances one pointer instead of Floyd's three.
+    
+    Args:
+        head: First node of the chain (or None)
+        
+    Returns:
+        (node where the cycle starts, cycle length), or (None, 0) if the
+        chain ends
         
-        return "[" + " <-> ".join(result) + "]"
+    Time Complexity: O(mu + lambda) for a tail of mu nodes and a cycle of lambda
+    Space Complexity: O(1)
+    """
+    if head is None:
+        return None, 0
+    
+    power = length = 1
+    tortoise, hare = head, head.next
+    while hare is not None and hare is not tortoise:
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = hare.next
+        length += 1
+    
+    if hare is None:
+        return None, 0
+    
+    # Start one pointer length nodes ahead; they meet at the cycle entry
+    tortoise = hare = head
+    for _ in range(length):
+        hare = hare.next
+    while tortoise is not hare:
+        tortoise = tortoise.next
+        hare = hare.next
+    
+    return tortoise, length
+
+
+def _chain_end(head):
+    """Return the number of nodes in a None-terminated chain and its last node."""
+    length, last = 0, None
+    while head is not None:
+        length, last = length + 1, head
+        head = head.next
+    return length, last
+
+
+def _reverse_chain(head):
+    """Reverse a None-terminated chain in place and return its new head."""
+    prev = None
+    while head is not None:
+        following = head.next
+        head.next = prev
+        prev = head
+        head = following
+    return prev
 
 
 def merge_sorted_lists(l1, l2):
@@ -436,6 +1844,293 @@ def merge_sorted_lists(l1, l2):
     return dummy.next
 
 
+def merge_k_sorted_lists(heads, key=None, method="heap"):
+    """
+    Merge k sorted linked lists into one sorted list by relinking their nodes.
+    
+    Merging pairwise costs O(nk); both methods here pick each next node out
+    of the k current list heads in O(log k). The merge is stable: nodes with
+    equal keys keep the order of the lists they came from.
+    
+    Args:
+        heads: Sequence of head nodes of sorted linked lists (None for an empty list)
+        key: Function extracting the comparison key from a node's data (default: compare the data)
+        method: "heap" (a binary heap of the current heads, fastest in CPython)
+                or "tournament" (a winner tree over the k lists that replays
+                exactly one leaf-to-root path, ceil(log2 k) matches, per node)
+        
+    Returns:
+        Head of merged sorted linked list
+        
+    Time Complexity: O(n log k) for n nodes in total
+    Space Complexity: O(k)
+    """
+    if key is None:
+        key = lambda data: data
+    
+    heads = [head for head in heads if head is not None]
+    if method == "heap":
+        return _merge_with_heap(heads, key)
+    if method == "tournament":
+        return _merge_with_tournament(heads, key)
+    raise ValueError("method must be 'heap' or 'tournament'")
+
+
+def _merge_with_heap(heads, key):
+    # The list index breaks ties, which keeps the merge stable and never compares nodes
+    heap = [(key(head.data), i, head) for i, head in enumerate(heads)]
+    heapq.heapify(heap)
+    dummy = Node(0)
+    tail = dummy
+    
+    while heap:
+        _, i, node = heap[0]
+        tail.next = node
+        tail = node
+        if node.next is not None:
+            heapq.heapreplace(heap, (key(node.next.data), i, node.next))
+        else:
+            heapq.heappop(heap)
+    
+    return dummy.next
+
+
+def _merge_with_tournament(heads, key):
+    if not heads:
+        return None
+    
+    size = 1
+    while size < len(heads):
+        size *= 2
+    
+    fronts = heads + [None] * (size - len(heads))  # Current node of each list
+    keys = [key(node.data) if node is not None else None for node in fronts]
+    
+    def winner(a, b):
+        # Exhausted lists always lose; ties go to the lower index (the left side)
+        if fronts[b] is None:
+            return a
+        if fronts[a] is None:
+            return b
+        return b if keys[b] < keys[a] else a
+    
+    # tree[i] is the list index winning the match at internal node i
+    tree = [0] * size + list(range(size))
+    for i in range(size - 1, 0, -1):
+        tree[i] = winner(tree[2 * i], tree[2 * i + 1])
+    
+    dummy = Node(0)
+    tail = dummy
+    
+    while fronts[tree[1]] is not None:
+        champion = tree[1]
+        node = fronts[champion]
+        tail.next = node
+        tail = node
+        
+        fronts[champion] = node.next
+        if node.next is not None:
+            keys[champion] = key(node.next.data)
+        
+        # Replay only the matches on the champion's path to the root
+        i = (size + champion) // 2
+        while i:
+            tree[i] = winner(tree[2 * i], tree[2 * i + 1])
+            i //= 2
+    
+    return dummy.next
+
+
+def _iter_source(source):
+    """Iterate over the data of a Node chain (None being an empty one), or over a plain iterable."""
+    if source is None or isinstance(source, (Node, DoublyNode)):
+        node = source
+        while node is not None:
+            yield node.data
+            node = node.next
+    else:
+        yield from source
+
+
+def iter_merge_sorted(*sources, key=None):
+    """
+    Lazily merge sorted sources, yielding one value at a time.
+    
+    Nothing is relinked or copied, so the sources may be longer than memory
+    allows to materialize (e.g. shard files read line by line).
+    
+    Args:
+        *sources: Head nodes of sorted linked lists, or sorted iterables
+        key: Function extracting the comparison key from a value (default: the value)
+        
+    Returns:
+        Generator over the merged values, stable across sources
+        
+    Time Complexity: O(n log k) for n values from k sources
+    Space Complexity: O(k)
+    """
+    return heapq.merge(*(_iter_source(source) for source in sources), key=key)
+
+
+def _next_run(node, key):
+    """
+    Cut the natural run starting at node off the chain.
+    
+    A run is the longest non-decreasing stretch, or the longest strictly
+    decreasing one, which is reversed in place (strictness keeps equal
+    elements in order, as in Timsort). With key None the data is compared
+    directly, saving a function call per node.
+    
+    Returns:
+        (run head, run tail, run length, first node after the run)
+    """
+    last_key = node.data if key is None else key(node.data)
+    current = node.next
+    length = 1
+    
+    if current is not None and (current.data if key is None else key(current.data)) < last_key:
+        run_head = node
+        while current is not None:
+            current_key = current.data if key is None else key(current.data)
+            if not current_key < last_key:
+                break
+            following = current.next
+            current.next = run_head
+            run_head = current
+            last_key = current_key
+            current = following
+            length += 1
+        node.next = None
+        return run_head, node, length, current
+    
+    run_tail = node
+    while current is not None:
+        current_key = current.data if key is None else key(current.data)
+        if current_key < last_key:
+            break
+        last_key = current_key
+        run_tail = current
+        current = current.next
+        length += 1
+    run_tail.next = None
+    return node, run_tail, length, current
+
+
+def _merge_runs(a, a_tail, b, b_tail, key):
+    """
+    Stably merge two sorted runs by relinking, taking from a on ties.
+    
+    With a key, each node's key is computed once when the node reaches
+    the front of its run; with key None the data is compared directly.
+    
+    Returns:
+        (head, tail) of the merged run
+    """
+    if key is None:
+        if b.data < a.data:
+            head = tail = b
+            b = b.next
+        else:
+            head = tail = a
+            a = a.next
+        while a is not None and b is not None:
+            if b.data < a.data:
+                tail.next = b
+                tail = b
+                b = b.next
+            else:
+                tail.next = a
+                tail = a
+                a = a.next
+    else:
+        a_key, b_key = key(a.data), key(b.data)
+        if b_key < a_key:
+            head = tail = b
+            b = b.next
+            if b is not None:
+                b_key = key(b.data)
+        else:
+            head = tail = a
+            a = a.next
+            if a is not None:
+                a_key = key(a.data)
+        
+        while a is not None and b is not None:
+            if b_key < a_key:
+                tail.next = b
+                tail = b
+                b = b.next
+                if b is not None:
+                    b_key = key(b.data)
+            else:
+                tail.next = a
+                tail = a
+                a = a.next
+                if a is not None:
+                    a_key = key(a.data)
+    
+    if a is not None:
+        tail.next = a
+        return head, a_tail
+    tail.next = b
+    return head, (b_tail if b is not None else tail)
+
+
+def _merge_at(runs, i, key):
+    """Replace runs[i] and runs[i + 1] on the run stack with their merge."""
+    a_head, a_tail, a_length = runs[i]
+    b_head, b_tail, b_length = runs.pop(i + 1)
+    runs[i] = (*_merge_runs(a_head, a_tail, b_head, b_tail, key), a_length + b_length)
+
+
+def merge_sort_chain(head, key=None):
+    """
+    Stable natural merge sort of a None-terminated chain of nodes.
+    
+    The chain is split into its natural runs, which are merged bottom-up
+    by relinking the existing nodes, so no node is allocated. Pending runs
+    are kept on a stack with Timsort's invariants: every run is longer
+    than the next one up, and longer than the next two combined. Run
+    lengths therefore grow at least like the Fibonacci numbers down the
+    stack, which bounds it to O(log n) entries and keeps the merges
+    balanced. Only next pointers are touched; doubly linked callers fix
+    prev afterwards.
+    
+    Args:
+        head: First node of the chain (or None)
+        key: Function extracting the comparison key from a node's data (default: compare the data)
+        
+    Returns:
+        (head, tail) of the sorted chain
+        
+    Time Complexity: O(n log n), and O(n) on sorted or reversed input
+    Space Complexity: O(log n)
+    """
+    runs = []  # (head, tail, length) of pending runs
+    node = head
+    while node is not None:
+        run_head, run_tail, length, node = _next_run(node, key)
+        runs.append((run_head, run_tail, length))
+        
+        # Restore the invariants, merging the smaller neighbour of the middle run
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if ((i > 0 and runs[i - 1][2] <= runs[i][2] + runs[i + 1][2])
+                    or (i > 1 and runs[i - 2][2] <= runs[i - 1][2] + runs[i][2])):
+                if runs[i - 1][2] < runs[i + 1][2]:
+                    i -= 1
+            elif runs[i][2] > runs[i + 1][2]:
+                break
+            _merge_at(runs, i, key)
+    
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][2] < runs[i + 1][2]:
+            i -= 1
+        _merge_at(runs, i, key)
+    
+    return runs[0][:2] if runs else (None, None)
+
 if __name__ == "__main__":
     # Test Singly Linked List
     print("Testing Singly Linked List...")
@@ -450,7 +2145,12 @@ if __name__ == "__main__":
     print(f"List: {sll}")
     print(f"Size: {len(sll)}")
     
+    sll.extend([6, 7])
+    print(f"After extend([6, 7]): {sll}")
+    print(f"Built with from_iterable: {SinglyLinkedList.from_iterable(range(5))}")
+    
     print(f"Element at position 2: {sll.get(2)}")
+    print(f"Every second element: {list(sll.islice(0, None, 2))}, contains 4: {4 in sll}")
     print(f"Position of element 4: {sll.search(4)}")
     
     print(f"Deleting element at beginning: {sll.delete_at_beginning()}")
@@ -468,6 +2168,49 @@ if __name__ == "__main__":
     
     print(f"Middle element: {sll.find_middle()}")
     
+    sll.extend([9, 1, 8])
+    sll.sort()
+    print(f"Sorted in place: {sll}")
+    
+    sll.reverse_in_groups(2)
+    print(f"Reversed in groups of 2: {sll}")
+    rest = sll.split_at(3)
+    print(f"split_at(3): {sll} and {rest}")
+    rest.reverse_range(0, 3)
+    sll.concat(rest)
+    print(f"After reverse_range(0, 3) and concat: {sll}")
+    
+    cyclic = SinglyLinkedList.from_iterable(range(6))
+    cyclic.guarded = True
+    cyclic.tail.next = cyclic.head.next.next  # Corrupt the chain into a cycle
+    start, length = cyclic.find_cycle()
+    print(f"Cycle starts at {start!r} with length {length}; guarded str: {cyclic}")
+    
+    palindrome = SinglyLinkedList.from_iterable("racecar")
+    print(f"'racecar' is a palindrome: {palindrome.is_palindrome()}, list intact: {palindrome}")
+    shared = SinglyLinkedList.from_iterable([7, 8, 9])
+    first, second = SinglyLinkedList.from_iterable([1, 2, 0]), SinglyLinkedList.from_iterable([3])
+    first.tail.next = second.tail.next = shared.head  # Both lists now end in 7 -> 8 -> 9
+    print(f"Intersection starts at {first.intersection(second)!r}")
+    
+    # Test Indexed Singly Linked List
+    print("\nTesting Indexed Singly Linked List...")
+    indexed = IndexedSinglyLinkedList.from_iterable(range(0, 100, 10))
+    indexed.insert_at_position(55, 6)
+    print(f"List: {indexed}")
+    print(f"Element at position 6: {indexed.get(6)}")
+    print(f"Deleting element at position 3: {indexed.delete_at_position(3)}")
+    print(f"List after deletion: {indexed}")
+    
+    # Test Unrolled Linked List
+    print("\nTesting Unrolled Linked List...")
+    unrolled = UnrolledLinkedList.from_iterable(range(10), block_size=4)
+    unrolled.insert_at_position(99, 2)
+    print(f"List: {unrolled}")
+    print(f"Element at position 5: {unrolled.get(5)}")
+    print(f"Deleting element at position 0: {unrolled.delete_at_position(0)}")
+    print(f"List after deletion: {unrolled}, middle element: {unrolled.find_middle()}")
+    
     # Test Doubly Linked List
     print("\nTesting Doubly Linked List...")
     dll = DoublyLinkedList()
@@ -484,6 +2227,13 @@ if __name__ == "__main__":
     print(f"Element at position 2: {dll.get(2)}")
     print(f"Position of element 4: {dll.search(4)}")
     
+    indexed_dll = DoublyLinkedList(value_index=True)
+    for value in "abcde":
+        indexed_dll.insert_at_end(value)
+    print(f"Value-indexed list contains 'c': {indexed_dll.contains('c')}")
+    indexed_dll.delete_value("c")
+    print(f"After delete_value('c'): {indexed_dll}")
+    
     print(f"Deleting element at beginning: {dll.delete_at_beginning()}")
     print(f"List after deletion: {dll}")
     
@@ -493,6 +2243,23 @@ if __name__ == "__main__":
     print(f"Deleting element at position 1: {dll.delete_at_position(1)}")
     print(f"List after deletion: {dll}")
     
+    print(f"Iterating backwards: {list(reversed(dll))}")
+    
+    dll.insert_at_end(0)
+    dll.sort(key=lambda value: -value)
+    print(f"Sorted by descending value: {dll}")
+    
     print("Reversing the list...")
     dll.reverse()
-    print(f"Reversed list: {dll}")
\ No newline at end of file
+    print(f"Reversed list: {dll}")
+    
+    # Test k-way merge
+    print("\nTesting k-way merge...")
+    shards = [SinglyLinkedList.from_iterable(values) for values in ([1, 4, 7], [2, 5, 8], [0, 3, 6, 9])]
+    node = merge_k_sorted_lists([shard.head for shard in shards], method="tournament")
+    merged = []
+    while node:
+        merged.append(node.data)
+        node = node.next
+    print(f"Merged shards: {merged}")
+    print(f"Lazy merge by length: {list(iter_merge_sorted(['a', 'ccc'], ['bb', 'dddd'], key=len))}")
@@ -41,6 +41,8 @@ class ArrayStack:
 
 class Node:
     """A node in a linked list."""
+    __slots__ = ("data", "next")
+    
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -85,19 +87,72 @@ class LinkedListStack:
         """Return the number of items in the stack."""
         return self._size
     
+    def __iter__(self):
+        """Iterate from the top of the stack down, without copying it."""
+        current = self.top
+        while current:
+            yield current.data
+            current = current.next
+    
     def __str__(self):
         """Return a string representation of the stack."""
         if self.is_empty():
             return "[]"
         
-        result = []
-        current = self.top
-        
-        while current:
-            result.append(str(current.data))
-            current = current.next
+        return "[" + ", ".join(map(str, self)) + "] <- Top"
+
+
+class ArrayLinkedListStack:
+    """
+    LinkedListStack with its nodes flattened into one array.
+    
+    Because a stack only ever links a new node to the current top, the node
+    below slot i is always slot i - 1: the next pointers are implicit, and
+    no link array or free list is needed. Popped slots are always the last
+    ones, so popping releases them and the list shrinks its storage as it
+    drains. The result costs one reference (8 bytes) per element, instead
+    of the 48 bytes of a slotted node (88 with __dict__), and iterates
+    top-down like LinkedListStack.
+    """
+    
+    def __init__(self):
+        """Initialize an empty stack."""
+        self._values = []  # Slot i holds the node directly above slot i - 1
+    
+    def push(self, item):
+        """Add an item to the top of the stack."""
+        self._values.append(item)
+    
+    def pop(self):
+        """Remove and return the top item from the stack."""
+        if self.is_empty():
+            raise Exception("Stack is empty")
+        return self._values.pop()
+    
+    def peek(self):
+        """Return the top item without removing it."""
+        if self.is_empty():
+            raise Exception("Stack is empty")
+        return self._values[-1]
+    
+    def is_empty(self):
+        """Check if the stack is empty."""
+        return not self._values
+    
+    def size(self):
+        """Return the number of items in the stack."""
+        return len(self._values)
+    
+    def __iter__(self):
+        """Iterate from the top of the stack down, without copying it."""
+        return reversed(self._values)
+    
+    def __str__(self):
+        """Return a string representation of the stack."""
+        if self.is_empty():
+            return "[]"
         
-        return "[" + ", ".join(result) + "] <- Top"
+        return "[" + ", ".join(map(str, self)) + "] <- Top"
 
 
 from collections import deque
@@ -291,6 +346,20 @@ if __name__ == "__main__":
     print(f"Popped element: {linked_stack.pop()}")
     print(f"Stack after pop: {linked_stack}")
     
+    # Test ArrayLinkedListStack
+    print("\nTesting ArrayLinkedListStack...")
+    array_linked_stack = ArrayLinkedListStack()
+    
+    array_linked_stack.push(1)
+    array_linked_stack.push(2)
+    array_linked_stack.push(3)
+    
+    print(f"Stack: {array_linked_stack}")
+    print(f"Size: {array_linked_stack.size()}")
+    print(f"Top element: {array_linked_stack.peek()}")
+    print(f"Popped element: {array_linked_stack.pop()}")
+    print(f"Stack after pop: {array_linked_stack}")
+    
     # Test DequeStack
     print("\nTesting DequeStack...")
     deque_stack = DequeStack()